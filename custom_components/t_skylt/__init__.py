@@ -2,28 +2,91 @@
 import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from .const import DOMAIN
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from .const import (
+    CONF_ENTITY_GROUPS,
+    DEFAULT_ENTITY_GROUPS,
+    DOMAIN,
+    ENTITY_GROUPS,
+    GROUP_DIAGNOSTICS,
+    GROUP_ENTITY_SUFFIXES,
+    GROUP_FIRMWARE,
+    GROUP_NETWORK,
+)
 from .coordinator import TSkyltCoordinator
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 # Registered platforms
 PLATFORMS = ["switch", "select", "number", "sensor", "binary_sensor", "text", "button"]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+def _platforms_for_groups(groups) -> list:
+    """Skip platforms that would not create any entity for the chosen groups."""
+    skipped = set()
+    if not groups & {GROUP_DIAGNOSTICS, GROUP_NETWORK}:
+        skipped.add("sensor")
+    if GROUP_FIRMWARE not in groups:
+        skipped.add("binary_sensor")
+    return [platform for platform in PLATFORMS if platform not in skipped]
+
+async def async_setup(hass: HomeAssistant, config) -> bool:
+    """Set up the T-Skylt services."""
+    await async_setup_services(hass)
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up T-Skylt from a config entry."""
-    coordinator = TSkyltCoordinator(hass, entry.data["host"])
+    coordinator = TSkyltCoordinator(hass, entry.data["host"], options=entry.options)
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Remember what was forwarded, unloading must use the same list
+    coordinator.platforms = _platforms_for_groups(coordinator.entity_groups)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+    _async_remove_deselected_entities(hass, entry, coordinator)
+
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     return True
 
+def _async_remove_deselected_entities(hass: HomeAssistant, entry: ConfigEntry, coordinator) -> None:
+    """
+    Drop registry entries of the groups the user deselected. Only those: an entity
+    missing for any other reason (e.g. a platform that failed to load) keeps its
+    entry with the user's name, area and disabled flag.
+    """
+    deselected = set(ENTITY_GROUPS) - coordinator.entity_groups
+    stale = {
+        f"{coordinator.host}_{suffix}" for group in deselected for suffix in GROUP_ENTITY_SUFFIXES[group]
+    }
+    if not stale:
+        return
+    registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if entity_entry.unique_id in stale:
+            _LOGGER.debug(f"Removing {entity_entry.entity_id}, no longer provided")
+            registry.async_remove(entity_entry.entity_id)
+
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply tuning options live; only a change of entity groups needs a reload."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    groups = set(entry.options.get(CONF_ENTITY_GROUPS, DEFAULT_ENTITY_GROUPS))
+    if groups != coordinator.entity_groups:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    coordinator.apply_options(entry.options)
+    # Re-schedule polling so a new interval takes effect right away
+    await coordinator.async_request_refresh()
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, coordinator.platforms)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
\ No newline at end of file
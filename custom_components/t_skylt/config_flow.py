@@ -6,7 +6,40 @@ import async_timeout
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
-from .const import DOMAIN
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from .const import (
+    CONF_ADAPTIVE_TIMEOUTS,
+    CONF_COMMAND_RETRIES,
+    CONF_ENTITY_GROUPS,
+    CONF_MAX_HISTORY_IPS,
+    CONF_POLL_RETRIES,
+    CONF_RECORD_TRACE,
+    CONF_RETRY_DELAY,
+    CONF_SCAN_INTERVAL,
+    CONF_SLOT_PRELOAD,
+    CONF_STREAMING_PARSE,
+    CONF_TIMEOUT_FULL,
+    CONF_TIMEOUT_PROBE,
+    CONF_TOGGLE_MAX_AGE,
+    DEFAULT_ENTITY_GROUPS,
+    DOMAIN,
+    ENTITY_GROUPS,
+)
+from .coordinator import (
+    ADAPTIVE_TIMEOUTS,
+    COMMAND_RETRIES,
+    MAX_HISTORY_IPS,
+    POLL_RETRIES,
+    POLLING_INTERVAL,
+    RECORD_TRACE,
+    RETRY_DELAY,
+    SLOT_PRELOAD,
+    STREAMING_PARSE,
+    TIMEOUT_FULL,
+    TIMEOUT_PROBE,
+    TOGGLE_MAX_AGE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,6 +48,12 @@ class TSkyltConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow."""
+        return TSkyltOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         errors = {}
@@ -46,4 +85,48 @@ class TSkyltConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_HOST, default="esp32-s3-zero.local"): str,
             }),
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+class TSkyltOptionsFlow(config_entries.OptionsFlow):
+    """Handle per-board options."""
+
+    def __init__(self, config_entry):
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Entity groups and connection tuning for this board."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+
+        def default(key, value):
+            return {"default": options.get(key, value)}
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(CONF_ENTITY_GROUPS, **default(CONF_ENTITY_GROUPS, DEFAULT_ENTITY_GROUPS)):
+                    cv.multi_select(ENTITY_GROUPS),
+                vol.Optional(CONF_SCAN_INTERVAL, **default(CONF_SCAN_INTERVAL, POLLING_INTERVAL)):
+                    vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Optional(CONF_TIMEOUT_FULL, **default(CONF_TIMEOUT_FULL, TIMEOUT_FULL)):
+                    vol.All(vol.Coerce(float), vol.Range(min=1, max=120)),
+                vol.Optional(CONF_TIMEOUT_PROBE, **default(CONF_TIMEOUT_PROBE, TIMEOUT_PROBE)):
+                    vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+                vol.Optional(CONF_RETRY_DELAY, **default(CONF_RETRY_DELAY, RETRY_DELAY)):
+                    vol.All(vol.Coerce(float), vol.Range(min=0, max=30)),
+                vol.Optional(CONF_ADAPTIVE_TIMEOUTS, **default(CONF_ADAPTIVE_TIMEOUTS, ADAPTIVE_TIMEOUTS)): bool,
+                vol.Optional(CONF_POLL_RETRIES, **default(CONF_POLL_RETRIES, POLL_RETRIES)):
+                    vol.All(vol.Coerce(int), vol.Range(min=0, max=10)),
+                vol.Optional(CONF_COMMAND_RETRIES, **default(CONF_COMMAND_RETRIES, COMMAND_RETRIES)):
+                    vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
+                vol.Optional(CONF_MAX_HISTORY_IPS, **default(CONF_MAX_HISTORY_IPS, MAX_HISTORY_IPS)):
+                    vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                vol.Optional(CONF_TOGGLE_MAX_AGE, **default(CONF_TOGGLE_MAX_AGE, TOGGLE_MAX_AGE)):
+                    vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+                vol.Optional(CONF_STREAMING_PARSE, **default(CONF_STREAMING_PARSE, STREAMING_PARSE)): bool,
+                vol.Optional(CONF_RECORD_TRACE, **default(CONF_RECORD_TRACE, RECORD_TRACE)): bool,
+                vol.Optional(CONF_SLOT_PRELOAD, **default(CONF_SLOT_PRELOAD, SLOT_PRELOAD)): bool,
+            }),
+        )
@@ -1,3 +1,45 @@
 """Constants for the T-Skylt integration."""
 DOMAIN = "t_skylt"
-CONF_HOST = "host"
\ No newline at end of file
+CONF_HOST = "host"
+DATA_STATION_INDEX = f"{DOMAIN}_station_index"
+DATA_ROLLOUT = f"{DOMAIN}_rollout"
+
+# --- Entity Groups (selectable per board in the options) ---
+CONF_ENTITY_GROUPS = "entity_groups"
+GROUP_TIMERS = "timers"            # Weekly timer fields + "Clear Timers"
+GROUP_NETWORK = "network"          # Ping/DNS buttons + active IP sensor
+GROUP_FIRMWARE = "firmware"        # Update/downgrade buttons + update sensor
+GROUP_DIAGNOSTICS = "diagnostics"  # Temperature + uptime sensors
+GROUP_SEARCH = "search"            # Station search field + result list
+ENTITY_GROUPS = {
+    GROUP_TIMERS: "Timers",
+    GROUP_NETWORK: "Network Tools",
+    GROUP_FIRMWARE: "Firmware",
+    GROUP_DIAGNOSTICS: "Diagnostics",
+    GROUP_SEARCH: "Station Search",
+}
+DEFAULT_ENTITY_GROUPS = list(ENTITY_GROUPS)
+# Unique ID suffixes (unique_id = f"{host}_{suffix}") of the entities each group creates.
+# Registry entries of deselected groups are removed on setup, keep in sync with the platforms.
+_TIMER_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+GROUP_ENTITY_SUFFIXES = {
+    GROUP_TIMERS: ("btn_cleartimer", *(f"timer_{day}_{edge}" for day in _TIMER_DAYS for edge in ("start", "end"))),
+    GROUP_NETWORK: ("btn_ping", "btn_dns", "sensor_active_ip"),
+    GROUP_FIRMWARE: ("btn_update?update=true", "btn_ver?ver=1", "update_available"),
+    GROUP_DIAGNOSTICS: ("sensor_temperature", "sensor_uptime"),
+    GROUP_SEARCH: ("searchstation", "select_search_result"),
+}
+
+# --- Tuning Options (applied live to the running coordinator) ---
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_MAX_HISTORY_IPS = "max_history_ips"
+CONF_TIMEOUT_FULL = "timeout_full"
+CONF_TIMEOUT_PROBE = "timeout_probe"
+CONF_RETRY_DELAY = "retry_delay"
+CONF_ADAPTIVE_TIMEOUTS = "adaptive_timeouts"
+CONF_POLL_RETRIES = "poll_retries"
+CONF_COMMAND_RETRIES = "command_retries"
+CONF_TOGGLE_MAX_AGE = "toggle_max_age"
+CONF_STREAMING_PARSE = "streaming_parse"
+CONF_RECORD_TRACE = "record_trace"
+CONF_SLOT_PRELOAD = "slot_preload"
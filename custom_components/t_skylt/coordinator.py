@@ -1,17 +1,41 @@
 """DataUpdateCoordinator for T-Skylt."""
 import logging
 import asyncio
+import codecs
 import aiohttp
 import async_timeout
 import re
 import socket
+import time
+import urllib.parse
 from collections import deque
-from bs4 import BeautifulSoup
 from datetime import timedelta
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.core import HomeAssistant
-from .const import DOMAIN
+from homeassistant.helpers.entity import DeviceInfo
+from .const import (
+    CONF_ADAPTIVE_TIMEOUTS,
+    CONF_COMMAND_RETRIES,
+    CONF_ENTITY_GROUPS,
+    CONF_MAX_HISTORY_IPS,
+    CONF_POLL_RETRIES,
+    CONF_RECORD_TRACE,
+    CONF_RETRY_DELAY,
+    CONF_SCAN_INTERVAL,
+    CONF_SLOT_PRELOAD,
+    CONF_STREAMING_PARSE,
+    CONF_TIMEOUT_FULL,
+    CONF_TIMEOUT_PROBE,
+    CONF_TOGGLE_MAX_AGE,
+    DEFAULT_ENTITY_GROUPS,
+    DOMAIN,
+)
+from .latency import LatencyTracker
+from .parser import StatusPageParser
+from .recorder import NULL_TRACE, TRACE_FILE, RequestRecorder
+from .search import SEARCH_FIELD, StationSearchCache, parse_search_html
+from .state import BoardState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,16 +44,71 @@ MAX_HISTORY_IPS = 5     # Maximum number of IPs to remember
 TIMEOUT_FULL = 20       # Seconds for standard data fetching
 TIMEOUT_PROBE = 4       # Seconds for fast connectivity checks
 RETRY_DELAY = 2         # Seconds between retries
+POLL_RETRIES = 3        # Phase 1 retries for status polling
+COMMAND_RETRIES = 0     # Retries for commands (0 = Fire & Forget)
+# Self-tuning: Timeouts follow the observed latency, clamped to these bounds
+ADAPTIVE_TIMEOUTS = True
+TIMEOUT_FULL_BOUNDS = (5, 60)
+TIMEOUT_PROBE_BOUNDS = (1, 10)
+RETRY_DELAY_BOUNDS = (0.5, 5)
 POLLING_INTERVAL = 60   # Seconds for standard status polling
+TOGGLE_MAX_AGE = 10     # Seconds a cached page may be old before a toggle triggers a refresh
+STREAMING_PARSE = True  # Parse the status page while it arrives and stop once all fields are read
+STREAM_CHUNK_SIZE = 1024
+PROBE_BYTES = 64        # Bytes read by a GET health probe (HEAD reads none)
+RECORD_TRACE = False    # Log every request to a rotating trace file (for offline replay)
+# Writes a station into a memory slot. Not documented by the manufacturer, it may also
+# switch the display to that slot, so the active slot is selected again right after it.
+# Preloading is opt-in until the call is confirmed.
+PRELOAD_COMMAND = "?newstation={station}&screen={slot}"
+SLOT_PRELOAD = False
+# Starts the OTA firmware update (the board flashes and reboots)
+UPDATE_COMMAND = "update?update=true"
+# Commands after which the board restarts (and the memory slot bookkeeping is void)
+REBOOT_COMMANDS = ("stop", UPDATE_COMMAND, "ver?", "?width=")
 
 class TSkyltCoordinator(DataUpdateCoordinator):
     """Class to manage fetching T-Skylt data."""
 
-    def __init__(self, hass: HomeAssistant, host: str):
+    def __init__(self, hass: HomeAssistant, host: str, options=None):
         """Initialize the coordinator."""
+        options = options or {}
         self.host = host
         self.sw_version = "Unknown"
+        # Optional entity groups the platforms should set up for this board (changes need a reload)
+        self.entity_groups = set(options.get(CONF_ENTITY_GROUPS, DEFAULT_ENTITY_GROUPS))
+        self.platforms = []
+        self._device_info = None
         self._lock = asyncio.Lock()
+        self.streaming_parse = STREAMING_PARSE
+        # LATENCY: Rolling durations of successful status updates and probes
+        self.adaptive_timeouts = ADAPTIVE_TIMEOUTS
+        self._full_latency = LatencyTracker(TIMEOUT_FULL, *TIMEOUT_FULL_BOUNDS)
+        self._probe_latency = LatencyTracker(TIMEOUT_PROBE, *TIMEOUT_PROBE_BOUNDS)
+        self.retry_delay_default = RETRY_DELAY
+        self.poll_retries = POLL_RETRIES
+        self.command_retries = COMMAND_RETRIES
+
+        # TRACE: Opt-in request recorder (see recorder.py)
+        self._recorder = None
+
+        # PROBE: None = unknown, False = firmware rejects HEAD (use a truncated GET)
+        self._head_supported = None
+
+        # TOGGLES: Desired end state per key, compacted until the lock is free
+        self.toggle_max_age = TOGGLE_MAX_AGE
+        self._pending_toggles = {}
+        self._last_refresh = 0.0
+
+        # SEARCH: Results of the last station search (list of {"name", "id"})
+        self.search_results = []
+        self._search_cache = StationSearchCache()
+
+        # SLOTS: Station last written into each memory slot ('?screen=1' / '?screen=2')
+        self.slot_preload = SLOT_PRELOAD
+        self._slot_stations = {"1": None, "2": None}
+        self._rotation = []
+        self._rotation_index = -1
 
         # LOGIC: Check if input is a static IP or a hostname
         self._is_static_ip = self._is_valid_ip(host)
@@ -48,7 +127,107 @@ class TSkyltCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=POLLING_INTERVAL),
+            # BoardState compares by value: unchanged polls don't trigger state writes
+            always_update=False,
         )
+        self.apply_options(options)
+
+    def apply_options(self, options):
+        """
+        Apply the tuning options of the config entry to the running coordinator.
+        Called on setup and whenever the options change; no reload needed.
+        """
+        self.update_interval = timedelta(seconds=options.get(CONF_SCAN_INTERVAL, POLLING_INTERVAL))
+        self._full_latency.default = options.get(CONF_TIMEOUT_FULL, TIMEOUT_FULL)
+        self._probe_latency.default = options.get(CONF_TIMEOUT_PROBE, TIMEOUT_PROBE)
+        # A configured timeout above the bound raises the ceiling, it is never capped
+        self._full_latency.ceiling = max(TIMEOUT_FULL_BOUNDS[1], self._full_latency.default)
+        self._probe_latency.ceiling = max(TIMEOUT_PROBE_BOUNDS[1], self._probe_latency.default)
+        self.retry_delay_default = options.get(CONF_RETRY_DELAY, RETRY_DELAY)
+        self.adaptive_timeouts = options.get(CONF_ADAPTIVE_TIMEOUTS, ADAPTIVE_TIMEOUTS)
+        self.poll_retries = options.get(CONF_POLL_RETRIES, POLL_RETRIES)
+        self.command_retries = options.get(CONF_COMMAND_RETRIES, COMMAND_RETRIES)
+        self.toggle_max_age = options.get(CONF_TOGGLE_MAX_AGE, TOGGLE_MAX_AGE)
+        self.streaming_parse = options.get(CONF_STREAMING_PARSE, STREAMING_PARSE)
+        self.slot_preload = options.get(CONF_SLOT_PRELOAD, SLOT_PRELOAD)
+
+        self._set_recording(options.get(CONF_RECORD_TRACE, RECORD_TRACE))
+
+        max_history = options.get(CONF_MAX_HISTORY_IPS, MAX_HISTORY_IPS)
+        if max_history != self._known_ips.maxlen:
+            # Keep the most recent IPs (left side) when shrinking
+            self._known_ips = deque(list(self._known_ips)[:max_history], maxlen=max_history)
+
+    def _set_recording(self, enabled):
+        if enabled and self._recorder is None:
+            path = self.hass.config.path(TRACE_FILE.format(host=self.host.replace(":", "_")))
+            self._recorder = RequestRecorder(path)
+        elif not enabled and self._recorder is not None:
+            # Joining the writer thread blocks, keep it out of the event loop
+            self.hass.async_add_executor_job(self._recorder.stop)
+            self._recorder = None
+
+    async def async_shutdown(self) -> None:
+        """Stop the trace recorder when the entry is unloaded."""
+        await super().async_shutdown()
+        if self._recorder is not None:
+            await self.hass.async_add_executor_job(self._recorder.stop)
+            self._recorder = None
+
+    def _trace(self, param, target_ip, phase):
+        if self._recorder is None:
+            return NULL_TRACE
+        return self._recorder.trace(param, target_ip, phase)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Device info shared by all entities, rebuilt only when the firmware version changes."""
+        if self._device_info is None or self._device_info.get("sw_version") != self.sw_version:
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.host)},
+                name="T-Skylt Board",
+                manufacturer="T-Skylt Sweden AB",
+                model="Departure Board",
+                sw_version=self.sw_version,
+            )
+        return self._device_info
+
+    @property
+    def timeout_full(self):
+        """Timeout for status updates/commands: p95 latency x safety factor, or the configured value."""
+        if not self.adaptive_timeouts:
+            return self._full_latency.default
+        return self._full_latency.derive()
+
+    @property
+    def timeout_probe(self):
+        """Timeout for health probes, derived like `timeout_full`."""
+        if not self.adaptive_timeouts:
+            return self._probe_latency.default
+        return self._probe_latency.derive()
+
+    @property
+    def retry_delay(self):
+        """
+        Pause between Phase 1 retries: about one typical (median) status request on slow
+        boards, never shorter than the configured delay (gives a rebooting board/WiFi time).
+        """
+        if not self.adaptive_timeouts or len(self._full_latency) == 0:
+            return self.retry_delay_default
+        low, high = RETRY_DELAY_BOUNDS
+        median = min(high, max(low, self._full_latency.percentile(0.5)))
+        return max(self.retry_delay_default, median)
+
+    def timing_diagnostics(self):
+        """Current timeouts and latency statistics for the diagnostics download."""
+        return {
+            "adaptive": self.adaptive_timeouts,
+            "timeout_full": round(self.timeout_full, 3),
+            "timeout_probe": round(self.timeout_probe, 3),
+            "retry_delay": round(self.retry_delay, 3),
+            "status_latency": self._full_latency.as_dict(),
+            "probe_latency": self._probe_latency.as_dict(),
+        }
 
     def _is_valid_ip(self, host_str: str) -> bool:
         return bool(re.match(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$", host_str))
@@ -62,6 +241,19 @@ class TSkyltCoordinator(DataUpdateCoordinator):
             _LOGGER.warning(f"DNS Resolution failed for {self.host}: {err}")
             return self.host
 
+    def _switch_ip(self, ip):
+        """Make `ip` the active address. Latency seen on the old IP says nothing about the new one."""
+        changed = ip != self._cached_ip
+        if changed:
+            self._full_latency.reset()
+            self._probe_latency.reset()
+        self._cached_ip = ip
+        self._add_to_history(ip)
+        if changed:
+            # The active IP sensor reads `_cached_ip`, not `data`: with `always_update=False`
+            # an unchanged page would not notify it, so do it here
+            self.async_update_listeners()
+
     def _add_to_history(self, ip):
         if ip in self._known_ips:
             self._known_ips.remove(ip)
@@ -77,59 +269,279 @@ class TSkyltCoordinator(DataUpdateCoordinator):
         await super().async_config_entry_first_refresh()
 
     async def _async_update_data(self):
-        """Standard Polling: Uses robust retry logic (3 attempts)."""
+        """Standard Polling: Uses robust retry logic (`poll_retries` retries + failover)."""
         async with self._lock:
-            return await self._execute_robust_request(param=None, max_retries=3)
+            data = await self._execute_robust_request(param=None, max_retries=self.poll_retries, failover=True)
+            self._last_refresh = time.monotonic()
+            self._carry_over(data)
+            return data
+
+    def _carry_over(self, data):
+        """Keep values the status page does not report (only known from our own commands)."""
+        if self.data is None or data is None:
+            return
+        data.screen, data.country = self.data.screen, self.data.country
+        data.color, data.width = self.data.color, self.data.width
+        if data.uptime is not None and self.data.uptime is not None and data.uptime < self.data.uptime:
+            # Uptime restarted: the board rebooted, whatever we knew about its slots is void
+            _LOGGER.debug("Board rebooted, forgetting memory slots and cached searches")
+            self._board_rebooted(data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Status Update: changed {sorted(data.diff(self.data)) or 'nothing'}")
 
     async def send_command(self, parameter):
-        """Command Logic: Fire & Forget (0 retries) to prevent queue jams."""
+        """
+        Command Logic: Fire & Forget (0 retries by default) to prevent queue jams.
+        Returns True if the board accepted the command, None if it was dropped.
+        """
+        async with self._lock:
+            result = await self._send(parameter)
+            if result is not None and parameter.startswith(REBOOT_COMMANDS):
+                self._board_rebooted()
+            return result
+
+    async def _send(self, parameter):
+        """Send a command with the command retry count, never failing over. Caller holds the lock."""
+        return await self._execute_robust_request(param=parameter, max_retries=self.command_retries, failover=False)
+
+    async def send_toggle(self, key, command, desired):
+        """
+        State-aware toggle: Only sends the toggle endpoint if the device state differs.
+
+        Toggle endpoints (e.g. '?listcolor=switch') invert the current state, so acting
+        on a stale cache would flip the board the wrong way. Before sending we refresh
+        the page if the cache is older than `toggle_max_age`. Calls queued behind the
+        lock for the same key are compacted: only the last desired state is applied.
+
+        Returns True if the device is (assumed to be) in the desired state afterwards.
+        """
+        self._pending_toggles[key] = (command, desired)
+        async with self._lock:
+            pending = self._pending_toggles.pop(key, None)
+            if pending is None:
+                # A call queued earlier already applied the net effect for this key
+                return self.data.is_on(key) == desired
+            command, desired = pending
+
+            if time.monotonic() - self._last_refresh > self.toggle_max_age:
+                # Fire & Forget refresh: on failure we fall back to the cached page
+                await self._refresh_once()
+
+            if self.data.is_on(key) == desired:
+                _LOGGER.debug(f"[Toggle] '{key}' already {'on' if desired else 'off'}. Skipping command.")
+                return True
+
+            if await self._send(command) is None:
+                return False
+            self.data.set_switch(key, desired)
+            return True
+
+    async def _refresh_once(self):
+        """Single status read without retries or failover. Caller holds the lock."""
+        fresh = await self._execute_robust_request(param=None, max_retries=0)
+        if fresh is not None:
+            self._last_refresh = time.monotonic()
+            self._carry_over(fresh)
+            self.async_set_updated_data(fresh)
+        return fresh
+
+    async def async_read_status(self, reread_version=False):
+        """
+        Read the status page once and publish it, e.g. while waiting for a reboot.
+        With `reread_version` the firmware version is parsed again.
+        Returns the new BoardState, or None if the board did not answer.
+        """
+        async with self._lock:
+            previous_version = self.sw_version
+            if reread_version:
+                self.sw_version = "Unknown"
+            fresh = await self._refresh_once()
+            if self.sw_version == "Unknown":
+                self.sw_version = previous_version
+            return fresh
+
+    async def async_start_firmware_update(self):
+        """Trigger the OTA update. Returns False if the board did not accept the command."""
+        async with self._lock:
+            if await self._send(UPDATE_COMMAND) is None:
+                return False
+            self._board_rebooted()
+            return True
+
+    def _board_rebooted(self, data=None):
+        """
+        Slot contents and the active slot are unknown again. Cached searches are
+        dropped too: the board may have forgotten stations it learned by searching.
+        """
+        self._slot_stations = {"1": None, "2": None}
+        self._search_cache.clear()
+        data = data or self.data
+        if data is not None:
+            data.screen = None
+
+    async def set_station(self, station_id):
+        """
+        Always write `station_id` into the active slot ('?newstation='), even if we
+        believe it is already there, e.g. to restore a station the firmware forgot.
+        Returns False if the command was not accepted.
+        """
+        async with self._lock:
+            encoded_val = urllib.parse.quote(station_id)
+            if await self._send(f"?newstation={encoded_val}") is None:
+                return False
+            if self.data.screen is None:
+                # We don't know which slot was written
+                self._slot_stations = {"1": None, "2": None}
+            else:
+                self._slot_stations[self.data.screen] = station_id
+            return True
+
+    async def show_station(self, station_id, next_station=None):
+        """
+        Double-buffered station switch using the two memory slots.
+
+        With `slot_preload` enabled, `next_station` is preloaded into the inactive slot.
+        If `station_id` was preloaded there, only '?screen=' is sent, so the display
+        flips instantly instead of going blank while the board fetches departures.
+        Otherwise the station is written to the active slot as before.
+
+        Returns False if the visible switch could not be sent.
+        """
         async with self._lock:
-            await self._execute_robust_request(param=parameter, max_retries=0)
+            if self.data.screen is None:
+                # The status page does not report the active slot: select one explicitly
+                if await self._send("?screen=1") is None:
+                    return False
+                self.data.screen = "1"
+            active = self.data.screen
+            inactive = "2" if active == "1" else "1"
+
+            if self.slot_preload and self._slot_stations[inactive] == station_id:
+                if await self._send(f"?screen={inactive}") is None:
+                    return False
+                self.data.screen = inactive
+                active, inactive = inactive, active
+            elif self._slot_stations[active] != station_id:
+                encoded_val = urllib.parse.quote(station_id)
+                if await self._send(f"?newstation={encoded_val}") is None:
+                    return False
+                self._slot_stations[active] = station_id
+
+            if self.slot_preload and next_station and self._slot_stations[inactive] != next_station:
+                preload = PRELOAD_COMMAND.format(station=urllib.parse.quote(next_station), slot=inactive)
+                # A dropped preload may still have reached the board: the slot content is unknown
+                self._slot_stations[inactive] = None
+                if await self._send(preload) is not None:
+                    self._slot_stations[inactive] = next_station
+                # Keep the shown station visible even if the preload switched slots
+                if await self._send(f"?screen={active}") is None:
+                    # Which slot is shown is unknown now, the next call selects one explicitly
+                    self.data.screen = None
+
+        self.async_update_listeners()
+        return True
+
+    async def rotate_stations(self, stations):
+        """
+        Advance to the next station of a rotation list, preloading the one after it.
+        Returns the station now shown, or None if the switch was dropped.
+        """
+        if stations != self._rotation:
+            self._rotation = list(stations)
+            self._rotation_index = -1
+        index = (self._rotation_index + 1) % len(stations)
+        next_station = stations[(index + 1) % len(stations)] if len(stations) > 1 else None
+        if not await self.show_station(stations[index], next_station):
+            return None
+        self._rotation_index = index
+        return stations[index]
+
+    async def send_search_command(self, station_name, use_cache=True):
+        """
+        Execute the two-step search (POST / then GET /search) and parse the hits.
+
+        Non-empty results are cached per (country, operator, query), so repeated
+        searches don't hit the board. `use_cache=False` always searches on the board
+        (the board learns stations by searching them). Returns the list of
+        candidates, or None on failure.
+        """
+        data = self.data or BoardState()
+        cache_key = self._search_cache.make_key(data.country, data.operator, station_name)
+        cached = self._search_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            _LOGGER.debug(f"Station search '{station_name}' served from cache ({len(cached)} results)")
+            self.set_search_results(cached)
+            return cached
 
-    async def send_search_command(self, station_name):
-        """Execute the two-step search (POST / then GET /search)."""
         async with self._lock:
             url_post = f"http://{self._cached_ip}/"
             url_get = f"http://{self._cached_ip}/search"
-            payload = {"sstring": station_name}
+            payload = {SEARCH_FIELD: station_name}
+            # Traced with the keys the fake board uses: "POST" and "search"
+            trace = self._trace("POST", self._cached_ip, "search")
+            error = None
 
             try:
                 async with aiohttp.ClientSession() as session:
-                    with async_timeout.timeout(TIMEOUT_FULL):
+                    with async_timeout.timeout(self._full_latency.default):
                         # Step 1: POST
                         async with session.post(
                             url_post, 
                             data=payload,
                             headers={"Connection": "close", "Host": self.host}
                         ) as resp1:
+                            trace.status = resp1.status
                             if resp1.status >= 400:
                                 raise Exception(f"Search POST Error {resp1.status}")
+                        trace.finish()
+                        trace = NULL_TRACE
                         
                         # Step 2: Delay (1 second, as requested)
                         await asyncio.sleep(1)
                         
                         # Step 3: GET
+                        trace = self._trace("search", self._cached_ip, "search")
                         async with session.get(
                             url_get,
                             headers={"Connection": "close", "Host": self.host}
                         ) as resp2:
+                            trace.status = resp2.status
                             if resp2.status >= 400:
                                 raise Exception(f"Search GET Error {resp2.status}")
-                                
-                return True
+                            html = await resp2.text()
+                            trace.body(html.encode())
             except Exception as err:
+                error = err
                 _LOGGER.error(f"Failed to execute station search: {err}")
-                return False
-
-    async def _execute_robust_request(self, param=None, max_retries=3):
+                return None
+            finally:
+                trace.finish(error)
+
+        results = parse_search_html(html)
+        if results:
+            # An empty page may just not have been ready yet, don't pin it for hours
+            self._search_cache.put(cache_key, results)
+        self.set_search_results(results)
+        return results
+
+    def set_search_results(self, results):
+        """Publish a result list (from the board or the local index) to the entities."""
+        self.search_results = results
+        self.async_update_listeners()
+
+    async def _execute_robust_request(self, param=None, max_retries=3, failover=None):
         """
         Executes a request with configurable robustness.
         
         Args:
             param: The command parameter (e.g., '?newstation=...'). None for status update.
             max_retries: Number of retries on current IP (0 for commands, 3 for polling).
+            failover: Run Phases 2-4 if Phase 1 fails. If False, soft fail (return None).
+                Defaults to True when retries are configured.
         """
         request_type = "Command" if param else "Status Update"
+        if failover is None:
+            failover = max_retries > 0
         
         # --- PHASE 1: Try Current IP (with optional Retries) ---
         # Ensure we run at least once (since range(1, 1) is empty)
@@ -137,7 +549,7 @@ class TSkyltCoordinator(DataUpdateCoordinator):
         
         for attempt in range(1, attempts_to_run + 1):
             try:
-                result = await self._perform_request(self._cached_ip, timeout=TIMEOUT_FULL, param=param)
+                result = await self._perform_request(self._cached_ip, timeout=self.timeout_full, param=param, phase="1")
                 if attempt > 1: 
                      _LOGGER.info(f"[{request_type}] RECOVERED in Phase 1 (Attempt {attempt}) on {self._cached_ip}!")
                 return result
@@ -146,18 +558,19 @@ class TSkyltCoordinator(DataUpdateCoordinator):
                 
                 # Check if this was the last attempt
                 if attempt >= attempts_to_run:
-                    if max_retries == 0:
+                    if not failover:
                         # Soft fail for commands to avoid blocking
                         _LOGGER.warning(f"[{request_type}] Dropped command to avoid queueing. Device busy/unreachable.")
                         return None 
                     else:
                         _LOGGER.warning(f"[{request_type}] Phase 1: Final attempt {attempt} failed on {self._cached_ip}. Error: {err_msg}")
                 else:
-                    _LOGGER.warning(f"[{request_type}] Phase 1: Attempt {attempt} failed. Retrying in {RETRY_DELAY}s...")
-                    await asyncio.sleep(RETRY_DELAY)
+                    retry_delay = self.retry_delay
+                    _LOGGER.warning(f"[{request_type}] Phase 1: Attempt {attempt} failed. Retrying in {retry_delay:.1f}s...")
+                    await asyncio.sleep(retry_delay)
 
         # If Phase 1 failed and we are in Command mode, stop here.
-        if max_retries == 0:
+        if not failover:
             return None
 
         if self._is_static_ip:
@@ -170,13 +583,18 @@ class TSkyltCoordinator(DataUpdateCoordinator):
         for fallback_ip in history_list:
             if fallback_ip == self._cached_ip: continue
             
+            # Cheap probe first, the full request only runs on an IP that answers
             try:
-                result = await self._perform_request(fallback_ip, timeout=TIMEOUT_PROBE, param=param)
+                await self._probe(fallback_ip, timeout=self.timeout_probe, phase="2")
+            except Exception: continue
+
+            try:
+                result = await self._perform_request(fallback_ip, timeout=self.timeout_full, param=param, phase="2")
                 _LOGGER.warning(f"[{request_type}] Phase 2 SUCCESS! Device found at {fallback_ip}. Switching IP.")
-                self._cached_ip = fallback_ip
-                self._add_to_history(fallback_ip)
+                self._switch_ip(fallback_ip)
                 return result
-            except Exception: pass
+            except Exception as err:
+                _LOGGER.warning(f"[{request_type}] Phase 2: {fallback_ip} answered the probe but the request failed: {err}")
 
         # --- PHASE 3: DNS Resolution ---
         _LOGGER.warning(f"[{request_type}] Entering Phase 3: History exhausted. Resolving DNS for '{self.host}'...")
@@ -189,35 +607,146 @@ class TSkyltCoordinator(DataUpdateCoordinator):
         # --- PHASE 4: Final Attempt ---
         _LOGGER.warning(f"[{request_type}] Entering Phase 4: Final try on {new_ip} with full timeout...")
         try:
-            result = await self._perform_request(new_ip, timeout=TIMEOUT_FULL, param=param)
+            # Last resort: always the full configured timeout, never the tuned one
+            result = await self._perform_request(new_ip, timeout=self._full_latency.default, param=param, phase="4")
             _LOGGER.info(f"[{request_type}] Phase 4 SUCCESS! Connection established on {new_ip}")
-            self._cached_ip = new_ip
-            self._add_to_history(new_ip)
+            self._switch_ip(new_ip)
             return result
         except Exception as final_err:
             raise UpdateFailed(f"Device unavailable after Phase 4. Last IP tried: {new_ip}. Error: {final_err}")
 
-    async def _perform_request(self, target_ip, timeout=20, param=None):
+    async def async_check_health(self, timeout=None):
+        """Liveness check on the current IP without fetching/parsing the status page."""
+        async with self._lock:
+            try:
+                await self._probe(self._cached_ip, timeout=timeout or self.timeout_probe, phase="health")
+                return True
+            except Exception as err:
+                _LOGGER.debug(f"Health probe on {self._cached_ip} failed: {err or 'Timeout/Unreachable'}")
+                return False
+
+    async def _probe(self, target_ip, timeout=TIMEOUT_PROBE, phase="probe"):
+        """
+        Cheapest possible request: HEAD / (status only). If the firmware rejects
+        HEAD (error status, dropped or reset connection), fall back to GET / and
+        read only the first bytes. Raises on failure.
+
+        The fallback GET is traced as its own request (param None, like a status
+        read), so a replay scripts the HEAD and the GET separately.
+        """
+        url = f"http://{target_ip}/"
+        headers = {"Connection": "close", "Host": self.host}
+        started = time.monotonic()
+        trace = self._trace("HEAD" if self._head_supported is not False else None, target_ip, phase)
+        error = None
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                with async_timeout.timeout(timeout):
+                    if self._head_supported is not False:
+                        try:
+                            async with session.head(url, headers=headers) as response:
+                                trace.status = response.status
+                                if response.status < 400:
+                                    self._head_supported = True
+                                    self._probe_latency.record(time.monotonic() - started)
+                                    return
+                            # Device answered, but HEAD is not handled: retry as GET below
+                            trace.finish()
+                        except aiohttp.ClientError as err:
+                            if isinstance(err, asyncio.TimeoutError):
+                                raise
+                            # Some firmwares drop/reset the connection on HEAD: retry as GET below
+                            _LOGGER.debug(f"HEAD probe on {target_ip} failed ({err!r}), retrying as GET")
+                            trace.finish(err)
+                        trace = self._trace(None, target_ip, phase)
+
+                    async with session.get(url, headers=headers) as response:
+                        trace.status = response.status
+                        if response.status >= 400:
+                            raise Exception(f"Probe Error {response.status}")
+                        head = await response.content.read(PROBE_BYTES)
+                        trace.body(head)
+                        if not head.lstrip().startswith(b"<"):
+                            raise Exception("Probe: Unexpected response")
+                        if self._head_supported is None:
+                            _LOGGER.debug(f"HEAD not supported by {self.host}, probing with truncated GET")
+                            self._head_supported = False
+                        self._probe_latency.record(time.monotonic() - started)
+        except BaseException as err:
+            error = err
+            if isinstance(err, asyncio.TimeoutError):
+                self._probe_latency.record_timeout(timeout)
+            raise
+        finally:
+            trace.finish(error)
+
+    async def _perform_request(self, target_ip, timeout=20, param=None, phase="1"):
         url = f"http://{target_ip}/"
         if param: url = f"http://{target_ip}/{param}"
+        started = time.monotonic()
+        trace = self._trace(param, target_ip, phase)
+        error = None
 
-        async with aiohttp.ClientSession() as session:
-            with async_timeout.timeout(timeout):
-                async with session.get(url, headers={"Connection": "close", "Host": self.host}) as response:
-                    # Commands: Just return True, do not wait for body or parsing
-                    if param is not None:
+        try:
+            async with aiohttp.ClientSession() as session:
+                with async_timeout.timeout(timeout):
+                    async with session.get(url, headers={"Connection": "close", "Host": self.host}) as response:
+                        trace.status = response.status
+                        # Commands: Just return True, do not wait for body or parsing
+                        if param is not None:
+                            if response.status >= 400:
+                                raise Exception(f"Command Error {response.status}")
+                            return True
+
+                        # Status Update: Parse HTML
                         if response.status >= 400:
-                            raise Exception(f"Command Error {response.status}")
-                        return True
+                            raise Exception(f"HTTP Error {response.status}")
+                        if self.streaming_parse:
+                            data = await self._parse_stream(response, trace)
+                        else:
+                            html = await response.text()
+                            trace.body(html.encode())
+                            data = self.parse_html(html)
+                        # Only full status reads feed the latency window (commands return early)
+                        self._full_latency.record(time.monotonic() - started)
+                        return data
+        except BaseException as err:
+            error = err
+            if isinstance(err, asyncio.TimeoutError):
+                # Censored sample, lets the derived timeout grow again on a slower board
+                self._full_latency.record_timeout(timeout)
+            raise
+        finally:
+            trace.finish(error)
+
+    async def _parse_stream(self, response, trace=NULL_TRACE):
+        """
+        Feed the body into the incremental parser while it arrives.
+        Reading stops as soon as all fields are captured; the rest of the page is
+        discarded when the connection closes.
+        """
+        parser = StatusPageParser(need_version=self.sw_version == "Unknown")
+        decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            trace.body(chunk)
+            parser.feed(decoder.decode(chunk))
+            if parser.complete:
+                break
+        else:
+            parser.feed(decoder.decode(b"", final=True))
+        parser.close()
 
-                    # Status Update: Parse HTML
-                    html = await response.text()
-                    if response.status >= 400:
-                        raise Exception(f"HTTP Error {response.status}")
-                    return self.parse_html(html)
+        if parser.sw_version:
+            self.sw_version = parser.sw_version
+        return parser.result()
 
     def parse_html(self, html):
-        """Parse HTML content to extract state."""
+        """Parse HTML content to extract state (full-page fallback to `StatusPageParser`)."""
+        # Imported on first parse to keep integration startup light
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(html, 'html.parser')
         data = {}
 
@@ -332,4 +861,4 @@ class TSkyltCoordinator(DataUpdateCoordinator):
                 match = re.search(r"(\d+)", uptime_td.text)
                 data['uptime'] = int(match.group(1)) if match else None
 
-        return data
\ No newline at end of file
+        return BoardState.from_raw(data)
@@ -0,0 +1,23 @@
+"""Diagnostics support for T-Skylt."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from .const import DOMAIN
+
+# The e-mail address stored on the board
+TO_REDACT = {"user"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "host": coordinator.host,
+        "active_ip": coordinator._cached_ip,
+        "known_ips": list(coordinator._known_ips),
+        "sw_version": coordinator.sw_version,
+        "head_supported": coordinator._head_supported,
+        "streaming_parse": coordinator.streaming_parse,
+        "timing": coordinator.timing_diagnostics(),
+        "data": async_redact_data(coordinator.data.as_dict() if coordinator.data else {}, TO_REDACT),
+    }
@@ -0,0 +1,26 @@
+"""Base entity for T-Skylt."""
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+
+class TSkyltEntity(CoordinatorEntity):
+    """
+    Common base for all T-Skylt entities.
+
+    Name, unique ID, icon and category are fixed at creation and stored as
+    `_attr_*` values, so state writes do not rebuild them. Device info is shared
+    through the coordinator.
+    """
+
+    def __init__(self, coordinator, unique_suffix, name, icon=None, category=None):
+        super().__init__(coordinator)
+        self._attr_name = f"T-Skylt {name}"
+        self._attr_unique_id = f"{coordinator.host}_{unique_suffix}"
+        if icon:
+            self._attr_icon = icon
+        if category:
+            self._attr_entity_category = category
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return self.coordinator.device_info
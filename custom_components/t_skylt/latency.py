@@ -0,0 +1,77 @@
+"""Rolling latency statistics for self-tuning timeouts."""
+import math
+from collections import deque
+
+# --- Configuration Constants ---
+LATENCY_WINDOW = 50     # Number of recent successful requests kept per board
+MIN_SAMPLES = 5         # Below this, the configured default is used
+PERCENTILE = 0.95       # Percentile the timeout is derived from
+SAFETY_FACTOR = 3.0     # Multiplier on top of the percentile
+BACKOFF_AFTER = 2       # Consecutive timeouts after which at least `default` is used again
+
+
+class LatencyTracker:
+    """
+    Keeps a rolling window of request durations and derives a timeout from it:
+    `percentile * factor`, clamped to [floor, ceiling]. Until enough samples
+    are collected, `default` is returned.
+
+    Timeouts enter the window as censored samples (the request took at least
+    the timeout), so the derived value can grow again. After `BACKOFF_AFTER`
+    timeouts in a row it never drops below `default` until a request succeeds.
+    """
+
+    def __init__(self, default, floor, ceiling, window=LATENCY_WINDOW, factor=SAFETY_FACTOR):
+        self.default = default
+        self.floor = floor
+        self.ceiling = ceiling
+        self.factor = factor
+        self._samples = deque(maxlen=window)
+        self._timeouts = 0
+
+    def record(self, seconds):
+        self._samples.append(seconds)
+        self._timeouts = 0
+
+    def record_timeout(self, seconds):
+        """A request hit its timeout after `seconds`: its real duration is at least that."""
+        self._samples.append(seconds)
+        self._timeouts += 1
+
+    def reset(self):
+        self._samples.clear()
+        self._timeouts = 0
+
+    def __len__(self):
+        return len(self._samples)
+
+    def percentile(self, fraction):
+        """Nearest-rank percentile of the current window, None if empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(fraction * len(ordered)))
+        return ordered[rank - 1]
+
+    def derive(self, fraction=PERCENTILE, factor=None):
+        """Value derived from the window, or `default` while there are too few samples."""
+        if len(self._samples) < MIN_SAMPLES:
+            return self.default
+        value = self.percentile(fraction) * (self.factor if factor is None else factor)
+        value = min(self.ceiling, max(self.floor, value))
+        if self._timeouts >= BACKOFF_AFTER:
+            return max(self.default, value)
+        return value
+
+    def as_dict(self):
+        """Statistics for diagnostics."""
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(PERCENTILE)
+        return {
+            "samples": len(self._samples),
+            "p50": round(p50, 3) if p50 is not None else None,
+            "p95": round(p95, 3) if p95 is not None else None,
+            "max": round(max(self._samples), 3) if self._samples else None,
+            "consecutive_timeouts": self._timeouts,
+            "derived": round(self.derive(), 3),
+        }
@@ -0,0 +1,228 @@
+"""Incremental status page parser for T-Skylt."""
+import re
+from html.parser import HTMLParser
+
+from .state import DAYS, BoardState, parse_minutes
+
+VERSION_RE = re.compile(r"v\.\s*\d+\.\d+")
+DIGITS_RE = re.compile(r"(\d+)")
+
+# Checkbox inputs: data key -> element id
+SWITCH_INPUTS = {
+    'onoff': 'onoff',
+    'listmode': 'abc',
+    'multiple': 'multiple',
+    'show_station': 'show_my_station',
+    'clocktime': 'clocktime',
+    'listcolor': 'LISTCOLOR',
+    'fontmini': 'FONTMINI',
+    'sleep': 'sleep',
+    'type_metro': 'METRO',
+    'type_bus': 'BUS',
+    'type_train': 'TRAIN',
+    'type_tram': 'TRAM',
+    'type_ship': 'SHIP',
+}
+
+# Value inputs: data key -> (element id, default)
+VALUE_INPUTS = {
+    'power': ('power', '20'),
+    'line_length': ('line_length', '3'),
+    'no_more_departures': ('no_more_departures', ''),
+    'mins': ('mins', ''),
+    'user': ('user', ''),
+}
+for _day in DAYS:
+    VALUE_INPUTS[f'{_day}_start'] = (f'{_day}StartTime', '00:00')
+    VALUE_INPUTS[f'{_day}_end'] = (f'{_day}EndTime', '00:00')
+
+# Selects: data key -> default (maxdest/offset fall back to an input of the same id)
+SELECTS = {'brightness': '0', 'scroll': '0', 'maxdest': '5', 'offset': '0'}
+SELECT_INPUT_FALLBACK = ('maxdest', 'offset')
+
+# Labels in <b> followed by a <td> holding the number
+SENSOR_LABELS = {
+    'temperature': re.compile("System temperature"),
+    'uptime': re.compile("Uptime"),
+}
+
+
+class StatusPageParser(HTMLParser):
+    """
+    Streaming parser for the status page.
+
+    Feed it the page chunk by chunk; `complete` turns True as soon as every
+    field has been seen, so the caller can stop reading the rest of the body.
+    `result()` builds the `BoardState` directly from the captured values.
+    """
+
+    def __init__(self, need_version=True):
+        super().__init__(convert_charrefs=True)
+        self.sw_version = None
+        self._need_version = need_version
+
+        self._inputs = {}           # element id -> attributes (first occurrence)
+        self._select_values = {}    # select id -> value of the selected option
+        self._selects_seen = set()
+        self._update_button = None  # None: not seen, else True if enabled
+        self._operator = None
+        self._sensors = {}
+
+        # Open element tracking
+        self._select = None
+        self._operator_label_seen = False
+        self._operator_text = None  # list of text parts while inside the operator button
+        self._bold_text = None      # list of text parts while inside <b>, None if nested tags
+        self._in_bold = False
+        self._sensor_pending = None
+        self._sensor_text = None    # list of text parts while inside the sensor <td>
+        self._text_run = []         # text since the last tag (may arrive split across chunks)
+
+        self._missing_inputs = {el_id for el_id in SWITCH_INPUTS.values()}
+        self._missing_inputs.update(el_id for el_id, _default in VALUE_INPUTS.values())
+        self._missing_selects = set(SELECTS)
+        self._missing_sensors = set(SENSOR_LABELS)
+
+    @property
+    def complete(self):
+        return (
+            not self._missing_inputs
+            and not self._missing_selects
+            and not self._missing_sensors
+            and self._operator is not None
+            and self._update_button is not None
+            and not self._need_version
+        )
+
+    # --- HTMLParser callbacks ---
+    def _flush_text(self):
+        if self._text_run:
+            text = "".join(self._text_run)
+            self._text_run = []
+            if self._need_version and VERSION_RE.search(text):
+                self.sw_version = text.strip()
+                self._need_version = False
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        attrs = dict(attrs)
+
+        if self._in_bold:
+            # <b> with nested tags has no plain .string, it can't be a sensor label
+            self._bold_text = None
+
+        if tag == 'input':
+            el_id = attrs.get('id')
+            if el_id and el_id not in self._inputs:
+                self._inputs[el_id] = attrs
+                self._missing_inputs.discard(el_id)
+                if el_id in SELECT_INPUT_FALLBACK:
+                    # Firmware renders these as <select> or as <input>, either one completes the field
+                    self._missing_selects.discard(el_id)
+        elif tag == 'select':
+            self._select = attrs.get('id')
+        elif tag == 'option':
+            if self._select and 'selected' in attrs and self._select not in self._select_values:
+                self._select_values[self._select] = attrs.get('value') or ''
+        elif tag == 'button':
+            onclick = attrs.get('onclick') or ''
+            if self._update_button is None and 'update=true' in onclick:
+                self._update_button = 'disabled' not in attrs
+            if self._operator_label_seen and self._operator is None and self._operator_text is None \
+                    and 'dropbtn' in (attrs.get('class') or '').split():
+                self._operator_text = []
+        elif tag == 'label':
+            if attrs.get('for') == 'operator':
+                self._operator_label_seen = True
+        elif tag == 'b':
+            self._in_bold = True
+            self._bold_text = []
+        elif tag == 'td':
+            if self._sensor_pending and self._sensor_text is None:
+                self._sensor_text = []
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag == 'select':
+            if self._select:
+                self._selects_seen.add(self._select)
+                self._missing_selects.discard(self._select)
+            self._select = None
+        elif tag == 'button':
+            if self._operator_text is not None:
+                raw_text = "".join(self._operator_text).strip()
+                self._operator = re.sub(r'[^a-zA-Z]+', '', raw_text).lower()
+                self._operator_text = None
+        elif tag == 'b':
+            if self._bold_text is not None and self._sensor_pending is None:
+                text = "".join(self._bold_text)
+                for key, pattern in SENSOR_LABELS.items():
+                    if key in self._missing_sensors and pattern.search(text):
+                        self._sensor_pending = key
+                        break
+            self._in_bold = False
+            self._bold_text = None
+        elif tag == 'td':
+            if self._sensor_text is not None:
+                match = DIGITS_RE.search("".join(self._sensor_text))
+                self._sensors[self._sensor_pending] = int(match.group(1)) if match else None
+                self._missing_sensors.discard(self._sensor_pending)
+                self._sensor_pending = None
+                self._sensor_text = None
+
+    def handle_data(self, data):
+        if self._need_version:
+            self._text_run.append(data)
+        if self._operator_text is not None:
+            self._operator_text.append(data)
+        if self._bold_text is not None:
+            self._bold_text.append(data)
+        if self._sensor_text is not None:
+            self._sensor_text.append(data)
+
+    # --- Result ---
+    def _get_value(self, el_id, default):
+        attrs = self._inputs.get(el_id)
+        if attrs is None: return default
+        val = (attrs.get('value') or '').strip()
+        if val: return val
+        val = (attrs.get('placeholder') or '').strip()
+        return val if val else default
+
+    def close(self):
+        super().close()
+        self._flush_text()
+
+    def result(self):
+        state = BoardState()
+        state.set_switch('update_available', bool(self._update_button))
+        if self._operator is not None:
+            state.operator = BoardState.convert('operator', self._operator)
+
+        for key, el_id in SWITCH_INPUTS.items():
+            attrs = self._inputs.get(el_id)
+            if attrs is not None and 'checked' in attrs:
+                state.set_switch(key, True)
+
+        for key, default in SELECTS.items():
+            if key in self._selects_seen:
+                raw = self._select_values.get(key, default)
+            elif key in SELECT_INPUT_FALLBACK:
+                raw = self._get_value(key, default)
+            else:
+                raw = default
+            state.set(key, BoardState.convert(key, raw))
+
+        for key, (el_id, default) in VALUE_INPUTS.items():
+            raw = self._get_value(el_id, default)
+            if key.endswith(('_start', '_end')):
+                state.set_timer(key, parse_minutes(raw))
+            else:
+                state.set(key, BoardState.convert(key, raw))
+
+        state.temperature = self._sensors.get('temperature')
+        state.uptime = self._sensors.get('uptime')
+        return state
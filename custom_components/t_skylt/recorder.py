@@ -0,0 +1,92 @@
+"""Opt-in I/O trace recorder for T-Skylt."""
+import hashlib
+import json
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+_LOGGER = logging.getLogger(__name__)
+
+# --- Configuration Constants ---
+TRACE_FILE = "t_skylt_trace_{host}.jsonl"   # In the HA config directory
+TRACE_MAX_BYTES = 2 * 1024 * 1024           # Rotate after 2 MB
+TRACE_BACKUPS = 3                           # Keep 3 rotated files
+
+
+class RequestTrace:
+    """Timing/status/body hash of a single request, written on `finish()`."""
+
+    __slots__ = ("_recorder", "_param", "_ip", "_phase", "_wall", "_started", "status", "_hash")
+
+    def __init__(self, recorder, param, ip, phase):
+        self._recorder = recorder
+        self._param = param
+        self._ip = ip
+        self._phase = phase
+        self._wall = time.time()
+        self._started = time.monotonic()
+        self.status = None
+        self._hash = None
+
+    def body(self, data):
+        """Feed (part of) the response body into the hash."""
+        if self._hash is None:
+            self._hash = hashlib.blake2b(digest_size=8)
+        self._hash.update(data)
+
+    def finish(self, error=None):
+        self._recorder.write({
+            "t": round(self._wall, 3),
+            "p": self._param,
+            "ip": self._ip,
+            "ph": self._phase,
+            "d": round(time.monotonic() - self._started, 4),
+            # HTTP status, or the exception name if no response arrived
+            "s": self.status if self.status is not None else (type(error).__name__ if error else None),
+            "h": self._hash.hexdigest() if self._hash else None,
+        })
+
+
+class _NullTrace:
+    """Stand-in while recording is off, so callers need no conditionals."""
+
+    status = None
+
+    def body(self, data):
+        pass
+
+    def finish(self, error=None):
+        pass
+
+
+NULL_TRACE = _NullTrace()
+
+
+class RequestRecorder:
+    """
+    Writes one compact JSON line per request to a rotating file.
+    File I/O runs in a QueueListener thread, never in the event loop.
+    """
+
+    def __init__(self, path, max_bytes=TRACE_MAX_BYTES, backups=TRACE_BACKUPS):
+        self.path = path
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, delay=True, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._queue = queue.SimpleQueue()
+        self._listener = QueueListener(self._queue, handler)
+        self._handler = QueueHandler(self._queue)
+        self._listener.start()
+        _LOGGER.info(f"Recording request trace to {path}")
+
+    def trace(self, param, ip, phase):
+        return RequestTrace(self, param, ip, phase)
+
+    def write(self, record):
+        self._handler.emit(logging.makeLogRecord({"msg": json.dumps(record, separators=(",", ":"))}))
+
+    def stop(self):
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        _LOGGER.info(f"Stopped recording request trace to {self.path}")
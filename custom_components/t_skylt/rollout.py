@@ -0,0 +1,138 @@
+"""Staggered firmware rollout over several T-Skylt boards."""
+import asyncio
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# --- Configuration Constants ---
+ROLLOUT_WAVE_SIZE = 3         # Boards per wave
+ROLLOUT_CONCURRENCY = 2       # Boards flashing at the same time within a wave
+ROLLOUT_BOOT_TIMEOUT = 600    # Seconds a board may take to download, flash and answer again
+ROLLOUT_CHECK_INTERVAL = 15   # Seconds between checks while waiting for a board
+ROLLOUT_MAX_FAILURES = 0      # Failed boards tolerated before the rollout halts
+
+# --- Result States ---
+STATUS_UPDATED = "updated"
+STATUS_UP_TO_DATE = "up_to_date"      # No update available (and not forced)
+STATUS_UNREACHABLE = "unreachable"    # Offline before the update, left untouched
+STATUS_REJECTED = "rejected"          # Update command not accepted
+STATUS_TIMEOUT = "timeout"            # Did not come back within the boot timeout
+STATUS_UNHEALTHY = "unhealthy"        # Came back, but fails the health check
+STATUS_NOT_STARTED = "not_started"    # Rollout halted before this board's wave
+FAILED_STATES = {STATUS_REJECTED, STATUS_TIMEOUT, STATUS_UNHEALTHY}
+
+
+class FirmwareRollout:
+    """
+    Updates boards in waves instead of all at once.
+
+    Within a wave at most `concurrency` boards flash at the same time. Each board
+    must come back (uptime reset or new firmware version) and pass a health check.
+    If more than `max_failures` boards failed, the following waves are not started;
+    boards already flashing are always waited for.
+    """
+
+    def __init__(self, coordinators, wave_size=ROLLOUT_WAVE_SIZE, concurrency=ROLLOUT_CONCURRENCY,
+                 boot_timeout=ROLLOUT_BOOT_TIMEOUT, max_failures=ROLLOUT_MAX_FAILURES, force=False,
+                 check_interval=ROLLOUT_CHECK_INTERVAL):
+        self._coordinators = list(coordinators)
+        self.wave_size = wave_size
+        self.concurrency = concurrency
+        self.boot_timeout = boot_timeout
+        self.max_failures = max_failures
+        self.force = force
+        self.check_interval = check_interval
+
+    async def async_run(self):
+        """Run all waves and return the report."""
+        waves = [
+            self._coordinators[start:start + self.wave_size]
+            for start in range(0, len(self._coordinators), self.wave_size)
+        ]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = []
+        failures = 0
+        halt_reason = None
+
+        for number, wave in enumerate(waves, 1):
+            if halt_reason:
+                results += [self._result(coordinator, number, STATUS_NOT_STARTED) for coordinator in wave]
+                continue
+
+            _LOGGER.info(f"[Rollout] Wave {number}/{len(waves)}: {[c.host for c in wave]}")
+            wave_results = await asyncio.gather(
+                *(self._update_limited(semaphore, coordinator, number) for coordinator in wave)
+            )
+            results += wave_results
+            failures += sum(result["status"] in FAILED_STATES for result in wave_results)
+
+            if failures > self.max_failures:
+                halt_reason = f"{failures} board(s) failed after wave {number}, tolerated: {self.max_failures}"
+                _LOGGER.error(f"[Rollout] Halted. {halt_reason}")
+
+        updated = sum(result["status"] == STATUS_UPDATED for result in results)
+        _LOGGER.info(f"[Rollout] Finished: {updated} updated, {failures} failed")
+        return {
+            "halted": halt_reason is not None,
+            "reason": halt_reason,
+            "updated": updated,
+            "failed": failures,
+            "boards": results,
+        }
+
+    async def _update_limited(self, semaphore, coordinator, wave):
+        async with semaphore:
+            return await self._update_board(coordinator, wave)
+
+    @staticmethod
+    def _result(coordinator, wave, status, **extra):
+        return {"host": coordinator.host, "wave": wave, "status": status, **extra}
+
+    async def _update_board(self, coordinator, wave):
+        """Update one board and wait until it is back and healthy."""
+        started = time.monotonic()
+
+        # --- Pre-check: never start an update on a board that is already in trouble ---
+        before = None
+        if await coordinator.async_check_health():
+            before = await coordinator.async_read_status(reread_version=True)
+        if before is None:
+            _LOGGER.warning(f"[Rollout] {coordinator.host} is unreachable, skipping")
+            return self._result(coordinator, wave, STATUS_UNREACHABLE)
+
+        old_version = coordinator.sw_version
+        if not (self.force or before.update_available):
+            return self._result(coordinator, wave, STATUS_UP_TO_DATE, version=old_version)
+
+        _LOGGER.info(f"[Rollout] Updating {coordinator.host} ({old_version})")
+        if not await coordinator.async_start_firmware_update():
+            return self._result(coordinator, wave, STATUS_REJECTED, version=old_version)
+
+        # --- Wait for the reboot: uptime restarts or the version changes ---
+        deadline = time.monotonic() + self.boot_timeout
+        back = False
+        while not back and time.monotonic() < deadline:
+            await asyncio.sleep(self.check_interval)
+            if not await coordinator.async_check_health():
+                continue
+            state = await coordinator.async_read_status(reread_version=True)
+            if state is None:
+                continue
+            rebooted = state.uptime is not None and before.uptime is not None and state.uptime < before.uptime
+            back = rebooted or coordinator.sw_version != old_version
+
+        seconds = round(time.monotonic() - started)
+        if not back:
+            _LOGGER.error(f"[Rollout] {coordinator.host} did not come back within {self.boot_timeout}s")
+            return self._result(coordinator, wave, STATUS_TIMEOUT, version=old_version, seconds=seconds)
+
+        # --- Health gate: the board has to keep answering after the reboot ---
+        if not await coordinator.async_check_health():
+            _LOGGER.error(f"[Rollout] {coordinator.host} fails the health check after the update")
+            return self._result(coordinator, wave, STATUS_UNHEALTHY, version=coordinator.sw_version, seconds=seconds)
+
+        _LOGGER.info(f"[Rollout] {coordinator.host} updated: {old_version} -> {coordinator.sw_version} in {seconds}s")
+        return self._result(
+            coordinator, wave, STATUS_UPDATED, old_version=old_version, version=coordinator.sw_version, seconds=seconds
+        )
@@ -0,0 +1,89 @@
+"""Station search helpers for T-Skylt."""
+import re
+import time
+from collections import OrderedDict
+
+# --- Configuration Constants ---
+SEARCH_CACHE_SIZE = 32      # Maximum number of cached queries
+SEARCH_CACHE_TTL = 21600    # Seconds a cached result list stays valid (6 hours)
+
+# Station IDs show up in links/buttons like '/?newstation=9000100003'
+_STATION_ID_RE = re.compile(r"(?:newstation|station|id)=(\d{3,})")
+# ... or as a bare option value: same minimum length, so settings selects (0..8) never match
+_BARE_STATION_ID_RE = re.compile(r"^\d{3,}$")
+SEARCH_FIELD = "sstring"    # Name of the query input of the search form
+
+
+class StationSearchCache:
+    """Small LRU cache with TTL for search results, keyed by (country, operator, query)."""
+
+    def __init__(self, maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def make_key(country, operator, query):
+        return (country or "", operator or "", " ".join(query.split()).casefold())
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return results
+
+    def put(self, key, results):
+        self._entries[key] = (time.monotonic(), results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+def parse_search_html(html):
+    """
+    Extract candidate stations from the board's /search page.
+
+    The firmware renders each hit as a clickable element carrying the station ID
+    in its link/onclick/value. Returns a list of {"name": ..., "id": ...} dicts,
+    de-duplicated by ID and in page order.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    results = []
+    seen = set()
+
+    for el in soup.find_all(['a', 'button', 'option', 'input']):
+        if el.name == 'input' and (el.get('name') == SEARCH_FIELD or el.get('type') == 'checkbox'):
+            # The search form itself / settings switches, never a hit
+            continue
+        station_id = None
+        for attr in ('href', 'onclick', 'value'):
+            raw = el.get(attr)
+            if not raw: continue
+            match = _STATION_ID_RE.search(raw)
+            if match:
+                station_id = match.group(1)
+                break
+            # <option value="9000100003">Alexanderplatz</option>
+            if attr == 'value' and el.name == 'option' and _BARE_STATION_ID_RE.match(raw.strip()):
+                station_id = raw.strip()
+                break
+        if not station_id or station_id in seen:
+            continue
+
+        name = el.get_text(" ", strip=True)
+        if not name and el.name == 'input':
+            name = el.get('placeholder', '').strip()
+        seen.add(station_id)
+        results.append({"name": name or station_id, "id": station_id})
+
+    return results
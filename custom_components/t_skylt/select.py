@@ -3,10 +3,11 @@ import urllib.parse
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN
+from .const import DOMAIN, GROUP_SEARCH
+from .entity import TSkyltEntity
+from .state import BoardState
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up the T-Skylt selects."""
@@ -48,18 +49,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                      ["XS", "X", "XL"], EntityCategory.CONFIG),
     ]
 
+    # --- SEARCH (optional) ---
+    if GROUP_SEARCH in coordinator.entity_groups:
+        entities.append(TSkyltSearchResultSelect(coordinator))
+
     async_add_entities(entities)
 
 
-class TSkyltSelect(CoordinatorEntity, SelectEntity):
+class TSkyltSelect(TSkyltEntity, SelectEntity):
     """Representation of a T-Skylt Select."""
 
     def __init__(self, coordinator, key, name, icon, options, category=None):
         """Initialize the select."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, f"select_{key}", name, icon, category)
         self._key = key
-        self._name_suffix = name
-        self._icon = icon
         
         # Handle options: can be list or dict {label: value}
         if isinstance(options, dict):
@@ -68,34 +71,20 @@ class TSkyltSelect(CoordinatorEntity, SelectEntity):
         else:
             self._options_map = {opt: opt for opt in options}
             self._attr_options = options
-            
-        if category:
-            self._attr_entity_category = category
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self.coordinator.host)}, name="T-Skylt Board", manufacturer="T-Skylt Sweden AB", model="Departure Board", sw_version=self.coordinator.sw_version)
 
-    @property
-    def name(self): return f"T-Skylt {self._name_suffix}"
-    @property
-    def unique_id(self): return f"{self.coordinator.host}_select_{self._key}"
-    @property
-    def icon(self): return self._icon
+        # Reverse map (typed state value -> label) for O(1) lookups on every state write
+        self._labels_by_value = {}
+        for label, val in self._options_map.items():
+            self._labels_by_value.setdefault(BoardState.convert(key, val), label)
 
     @property
     def current_option(self):
         """Return the current selected option key."""
-        # Value from device (e.g., "1" or "be")
-        device_val = self.coordinator.data.get(self._key, "")
-        
-        # Find matching label key for this value
-        for label, val in self._options_map.items():
-            if str(val) == str(device_val):
-                return label
-        
+        # Typed value from device (e.g., 1 or Operator.VBB)
+        device_val = self.coordinator.data.get(self._key)
+
         # Fallback if unknown or initial load (default to first option)
-        return self._attr_options[0]
+        return self._labels_by_value.get(device_val, self._attr_options[0])
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -106,5 +95,40 @@ class TSkyltSelect(CoordinatorEntity, SelectEntity):
         await self.coordinator.send_command(f"?{self._key}={encoded_val}")
         
         # Optimistic update
-        self.coordinator.data[self._key] = value_to_send
-        self.async_write_ha_state()
\ No newline at end of file
+        self.coordinator.data.set(self._key, BoardState.convert(self._key, value_to_send))
+        self.async_write_ha_state()
+
+
+class TSkyltSearchResultSelect(TSkyltEntity, SelectEntity):
+    """
+    Lists the results of the last station search.
+    Selecting a result sends its ID as the new station.
+    """
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator, "select_search_result", "Station: Search Results", "mdi:map-search")
+        self._attr_current_option = None
+
+    @property
+    def options(self):
+        return [self._label(station) for station in self.coordinator.search_results]
+
+    @property
+    def current_option(self):
+        # Only keep the selection while it is part of the current result list
+        if self._attr_current_option in self.options:
+            return self._attr_current_option
+        return None
+
+    @staticmethod
+    def _label(station):
+        return f"{station['name']} ({station['id']})"
+
+    async def async_select_option(self, option: str) -> None:
+        """Send the ID of the chosen station."""
+        for station in self.coordinator.search_results:
+            if self._label(station) == option:
+                await self.coordinator.set_station(station["id"])
+                self._attr_current_option = option
+                self.async_write_ha_state()
+                return
@@ -0,0 +1,188 @@
+"""Services for the T-Skylt integration."""
+import logging
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from .const import DATA_ROLLOUT, DOMAIN
+from .rollout import (
+    ROLLOUT_BOOT_TIMEOUT,
+    ROLLOUT_CONCURRENCY,
+    ROLLOUT_MAX_FAILURES,
+    ROLLOUT_WAVE_SIZE,
+    FirmwareRollout,
+)
+from .station_index import DEFAULT_LIMIT, get_station_index
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_DEVICE_ID = "device_id"
+ATTR_QUERY = "query"
+ATTR_OPERATOR = "operator"
+ATTR_PATH = "path"
+ATTR_LIMIT = "limit"
+ATTR_STATIONS = "stations"
+ATTR_WAVE_SIZE = "wave_size"
+ATTR_CONCURRENCY = "concurrency"
+ATTR_BOOT_TIMEOUT = "boot_timeout"
+ATTR_MAX_FAILURES = "max_failures"
+ATTR_FORCE = "force"
+
+SERVICE_SEARCH_STATION = "search_station"
+SERVICE_FIND_STATION = "find_station"
+SERVICE_IMPORT_STATIONS = "import_stations"
+SERVICE_ROTATE_STATIONS = "rotate_stations"
+SERVICE_ROLLOUT_FIRMWARE = "rollout_firmware"
+
+# Lowercase code without path characters, it selects the index file (stations_<operator>.tsv)
+OPERATOR_CODE = vol.All(cv.string, vol.Lower, cv.slug)
+
+SEARCH_STATION_SCHEMA = vol.Schema({
+    vol.Required(ATTR_DEVICE_ID): cv.string,
+    vol.Required(ATTR_QUERY): cv.string,
+})
+
+FIND_STATION_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_OPERATOR): OPERATOR_CODE,
+        vol.Required(ATTR_QUERY): cv.string,
+        vol.Optional(ATTR_LIMIT, default=DEFAULT_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    }),
+    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_OPERATOR),
+)
+
+IMPORT_STATIONS_SCHEMA = vol.Schema({
+    vol.Required(ATTR_OPERATOR): OPERATOR_CODE,
+    vol.Required(ATTR_PATH): cv.string,
+})
+
+ROTATE_STATIONS_SCHEMA = vol.Schema({
+    vol.Required(ATTR_DEVICE_ID): cv.string,
+    vol.Required(ATTR_STATIONS): vol.All(cv.ensure_list, [cv.string], vol.Length(min=1)),
+})
+
+ROLLOUT_FIRMWARE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_WAVE_SIZE, default=ROLLOUT_WAVE_SIZE): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    vol.Optional(ATTR_CONCURRENCY, default=ROLLOUT_CONCURRENCY): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+    vol.Optional(ATTR_BOOT_TIMEOUT, default=ROLLOUT_BOOT_TIMEOUT): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
+    vol.Optional(ATTR_MAX_FAILURES, default=ROLLOUT_MAX_FAILURES): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+})
+
+
+def _get_coordinator(hass: HomeAssistant, device_id: str):
+    """Map a device ID to the coordinator of its config entry."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        raise HomeAssistantError(f"Unknown device: {device_id}")
+    for entry_id in device.config_entries:
+        coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+        if coordinator is not None:
+            return coordinator
+    raise HomeAssistantError(f"Device {device_id} is not a loaded T-Skylt board")
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_search_station(call: ServiceCall):
+        coordinator = _get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        results = await coordinator.send_search_command(call.data[ATTR_QUERY])
+        if results is None:
+            raise HomeAssistantError("Station search failed. Device busy/unreachable.")
+        return {"stations": results}
+
+    async def async_find_station(call: ServiceCall):
+        operator = call.data.get(ATTR_OPERATOR)
+        if operator is None:
+            # Use the operator the board is currently configured for
+            coordinator = _get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+            operator = coordinator.data.operator
+        try:
+            results = await get_station_index(hass).async_search(
+                operator, call.data[ATTR_QUERY], call.data[ATTR_LIMIT]
+            )
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        return {"operator": operator, "stations": results}
+
+    async def async_import_stations(call: ServiceCall):
+        path = call.data[ATTR_PATH]
+        if not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Access to {path} is not allowed (see allowlist_external_dirs)")
+        try:
+            count = await get_station_index(hass).async_import(call.data[ATTR_OPERATOR], path)
+        except (OSError, ValueError) as err:
+            raise HomeAssistantError(f"Station import failed: {err}") from err
+        return {"imported": count}
+
+    async def async_rotate_stations(call: ServiceCall):
+        coordinator = _get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        station = await coordinator.rotate_stations(call.data[ATTR_STATIONS])
+        if station is None:
+            raise HomeAssistantError("Station rotation failed. Device busy/unreachable.")
+        return {"station": station}
+
+    async def async_rollout_firmware(call: ServiceCall):
+        if hass.data.get(DATA_ROLLOUT) is not None:
+            raise HomeAssistantError("A firmware rollout is already running")
+        device_ids = call.data.get(ATTR_DEVICE_ID)
+        if device_ids:
+            # dict keeps the given order and drops duplicates
+            coordinators = list(dict.fromkeys(_get_coordinator(hass, device_id) for device_id in device_ids))
+        else:
+            coordinators = list(hass.data.get(DOMAIN, {}).values())
+        if not coordinators:
+            raise HomeAssistantError("No T-Skylt boards loaded")
+
+        rollout = hass.data[DATA_ROLLOUT] = FirmwareRollout(
+            coordinators,
+            wave_size=call.data[ATTR_WAVE_SIZE],
+            concurrency=call.data[ATTR_CONCURRENCY],
+            boot_timeout=call.data[ATTR_BOOT_TIMEOUT],
+            max_failures=call.data[ATTR_MAX_FAILURES],
+            force=call.data[ATTR_FORCE],
+        )
+        try:
+            return await rollout.async_run()
+        finally:
+            hass.data.pop(DATA_ROLLOUT, None)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ROLLOUT_FIRMWARE,
+        async_rollout_firmware,
+        schema=ROLLOUT_FIRMWARE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ROTATE_STATIONS,
+        async_rotate_stations,
+        schema=ROTATE_STATIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FIND_STATION,
+        async_find_station,
+        schema=FIND_STATION_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_STATIONS,
+        async_import_stations,
+        schema=IMPORT_STATIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH_STATION,
+        async_search_station,
+        schema=SEARCH_STATION_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,210 @@
+"""Typed state model for T-Skylt."""
+from dataclasses import dataclass, field, fields
+from enum import IntEnum, StrEnum
+
+DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+
+class Operator(StrEnum):
+    VBB = "be"
+    DB = "db"
+    VRR = "vrr"
+
+
+class LedColor(IntEnum):
+    ORANGE = 0
+    YELLOW = 1
+    WHITE = 2
+
+
+class Scroll(IntEnum):
+    NORMAL = 0
+    LOW = 1
+
+
+# Bit positions of the packed booleans
+SWITCHES = (
+    'onoff', 'listmode', 'multiple', 'show_station', 'clocktime', 'listcolor', 'fontmini', 'sleep',
+    'type_metro', 'type_bus', 'type_train', 'type_tram', 'type_ship', 'update_available',
+)
+_SWITCH_BITS = {key: 1 << bit for bit, key in enumerate(SWITCHES)}
+
+# Timer keys ('monday_start', 'monday_end', ...) -> index into BoardState.timers
+TIMER_KEYS = tuple(f'{day}_{edge}' for day in DAYS for edge in ('start', 'end'))
+_TIMER_INDEX = {key: index for index, key in enumerate(TIMER_KEYS)}
+
+
+def parse_minutes(value, default=0):
+    """'HH:MM' -> minutes since midnight."""
+    try:
+        hours, _sep, minutes = str(value).strip().partition(':')
+        return int(hours) * 60 + int(minutes or 0)
+    except ValueError:
+        return default
+
+
+def format_minutes(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def to_int(value, default=0):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def to_float(value, default=0.0):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def to_operator(value):
+    """Known operators become `Operator`, others are kept as plain lowercase text."""
+    value = str(value).lower()
+    try:
+        return Operator(value)
+    except ValueError:
+        return value
+
+
+def to_enum(enum_cls, default):
+    def convert(value):
+        try:
+            return enum_cls(to_int(value, default))
+        except ValueError:
+            return enum_cls(default)
+    return convert
+
+
+@dataclass(slots=True)
+class BoardState:
+    """
+    Parsed board state.
+
+    Booleans are packed into `flags`, timers are minutes since midnight and
+    option values are typed, so entities can use them without conversion.
+    Dataclass equality compares all fields, which lets the coordinator skip
+    listener updates when a poll returns an unchanged page.
+    """
+
+    flags: int = 0
+    operator: Operator | str = Operator.VBB
+    brightness: int = 0
+    scroll: Scroll = Scroll.NORMAL
+    maxdest: int = 5
+    offset: int = 0
+    power: float = 20.0
+    line_length: int = 3
+    no_more_departures: str = ""
+    mins: str = ""
+    user: str = ""
+    timers: list = field(default_factory=lambda: [0] * len(TIMER_KEYS))
+    temperature: int | None = None
+    uptime: int | None = None
+    # Not reported by the status page, only known after we set them
+    screen: str | None = None
+    country: str | None = None
+    color: LedColor | None = None
+    width: str | None = None
+
+    # --- Switches ---
+    def is_on(self, key):
+        return bool(self.flags & _SWITCH_BITS[key])
+
+    def set_switch(self, key, on):
+        if on:
+            self.flags |= _SWITCH_BITS[key]
+        else:
+            self.flags &= ~_SWITCH_BITS[key]
+
+    @property
+    def update_available(self):
+        return self.is_on('update_available')
+
+    # --- Timers ---
+    def timer(self, key):
+        return self.timers[_TIMER_INDEX[key]]
+
+    def set_timer(self, key, minutes):
+        self.timers[_TIMER_INDEX[key]] = minutes
+
+    # --- Generic access (selects / texts configured by key) ---
+    @staticmethod
+    def convert(key, raw):
+        """Convert a raw device string for `key` into the typed value."""
+        converter = _CONVERTERS.get(key)
+        return converter(raw) if converter else raw
+
+    def get(self, key, default=None):
+        if key in _SWITCH_BITS:
+            return self.is_on(key)
+        if key in _TIMER_INDEX:
+            return self.timer(key)
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def set(self, key, value):
+        """Optimistic update after a command, `value` is the typed value."""
+        if key in _SWITCH_BITS:
+            self.set_switch(key, value)
+        elif key in _TIMER_INDEX:
+            self.set_timer(key, value)
+        else:
+            setattr(self, key, value)
+
+    # --- Change detection ---
+    def diff(self, other):
+        """Names of the values that differ from `other` (switches/timers per key)."""
+        if other is None:
+            return set(SWITCHES) | set(TIMER_KEYS) | ({f.name for f in fields(self)} - {'flags', 'timers'})
+        changed = set()
+        if self.flags != other.flags:
+            changed_bits = self.flags ^ other.flags
+            changed.update(key for key, bit in _SWITCH_BITS.items() if changed_bits & bit)
+        if self.timers != other.timers:
+            changed.update(key for key, index in _TIMER_INDEX.items()
+                           if self.timers[index] != other.timers[index])
+        for f in fields(self):
+            if f.name in ('flags', 'timers'): continue
+            if getattr(self, f.name) != getattr(other, f.name):
+                changed.add(f.name)
+        return changed
+
+    def as_dict(self):
+        """Flat, readable representation (e.g. for diagnostics)."""
+        data = {key: self.is_on(key) for key in SWITCHES}
+        data.update({key: format_minutes(self.timer(key)) for key in TIMER_KEYS})
+        for f in fields(self):
+            if f.name in ('flags', 'timers'): continue
+            data[f.name] = getattr(self, f.name)
+        return data
+
+    @classmethod
+    def from_raw(cls, data):
+        """Build a state from a dict of raw strings (the `parse_html` fallback path)."""
+        state = cls()
+        for key, value in data.items():
+            if key in _SWITCH_BITS:
+                state.set_switch(key, value)
+            elif key in _TIMER_INDEX:
+                state.set_timer(key, parse_minutes(value))
+            elif key in ('temperature', 'uptime'):
+                setattr(state, key, value)
+            else:
+                state.set(key, cls.convert(key, value))
+        return state
+
+
+_CONVERTERS = {
+    'operator': to_operator,
+    'brightness': to_int,
+    'scroll': to_enum(Scroll, 0),
+    'maxdest': lambda value: to_int(value, 5),
+    'offset': to_int,
+    'power': lambda value: to_float(value, 20.0),
+    'line_length': lambda value: to_int(value, 3),
+    'color': to_enum(LedColor, 0),
+}
@@ -0,0 +1,172 @@
+"""Local station ID index for T-Skylt."""
+import bisect
+import csv
+import logging
+import os
+import re
+
+from homeassistant.core import HomeAssistant
+from .const import DATA_STATION_INDEX, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+INDEX_FILE = "stations_{operator}.tsv"   # One file per operator in <config>/t_skylt/
+DEFAULT_LIMIT = 10                       # Maximum number of hits per query
+
+# Operator codes become part of a file name: plain lowercase codes only ("be", "db", "vrr")
+_OPERATOR_RE = re.compile(r"^[a-z0-9_]+$")
+_WORD_START_RE = re.compile(r"(?:^|[\s\-/(,+.])(\w)")
+
+
+def normalize_station_id(operator, raw_id):
+    """
+    Convert an ID from a public station list into the format the board expects.
+
+    VBB ('be'): The public lists use 12-digit HAFAS IDs with two extra zeros,
+    e.g. '900000100003' -> '9000100003'.
+    Other operators: Only surrounding whitespace/non-digits are stripped, the
+    formats for DB/VRR have not been verified yet.
+    """
+    digits = re.sub(r"\D", "", str(raw_id))
+    if operator == "be" and len(digits) == 12 and digits.startswith("90000"):
+        return digits[0] + digits[3:]
+    return digits
+
+
+def _fold(text):
+    return " ".join(text.split()).casefold()
+
+
+class _OperatorIndex:
+    """Sorted, read-only lookup table for one operator."""
+
+    def __init__(self, entries):
+        # entries: list of (name, id) sorted by folded name
+        self._entries = entries
+        # Every word start is a search key, so "alexander" finds "S+U Alexanderplatz"
+        keys = []
+        for pos, (name, _station_id) in enumerate(entries):
+            folded = _fold(name)
+            for match in _WORD_START_RE.finditer(folded):
+                keys.append((folded[match.start(1):], pos))
+        keys.sort()
+        self._keys = [key for key, _pos in keys]
+        self._positions = [pos for _key, pos in keys]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def search(self, query, limit):
+        prefix = _fold(query)
+        if not prefix:
+            return []
+        results = []
+        seen = set()
+        start = bisect.bisect_left(self._keys, prefix)
+        for i in range(start, len(self._keys)):
+            if not self._keys[i].startswith(prefix):
+                break
+            pos = self._positions[i]
+            if pos in seen: continue
+            seen.add(pos)
+            name, station_id = self._entries[pos]
+            results.append({"name": name, "id": station_id})
+            if len(results) >= limit:
+                break
+        return results
+
+
+class StationIndex:
+    """Per-operator station indexes, loaded lazily from the config directory."""
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._indexes = {}
+
+    def _path(self, operator):
+        if not _OPERATOR_RE.match(operator):
+            # Never let the operator escape <config>/t_skylt/
+            raise ValueError(f"Invalid operator code: {operator!r}")
+        return self.hass.config.path(DOMAIN, INDEX_FILE.format(operator=operator))
+
+    def _load(self, operator):
+        path = self._path(operator)
+        entries = []
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                for line in handle:
+                    station_id, _sep, name = line.rstrip("\n").partition("\t")
+                    if station_id and name:
+                        entries.append((name, station_id))
+        _LOGGER.debug(f"Station index '{operator}': loaded {len(entries)} stations from {path}")
+        return _OperatorIndex(entries)
+
+    async def async_search(self, operator, query, limit=DEFAULT_LIMIT):
+        """Return up to `limit` stations whose name (or a word in it) starts with `query`."""
+        operator = str(operator).lower()
+        index = self._indexes.get(operator)
+        if index is None:
+            index = await self.hass.async_add_executor_job(self._load, operator)
+            self._indexes[operator] = index
+        return index.search(query, limit)
+
+    def _import(self, operator, source):
+        with open(source, encoding="utf-8-sig", newline="") as handle:
+            sample = handle.read(4096)
+            handle.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+            except csv.Error:
+                dialect = csv.excel
+            rows = csv.reader(handle, dialect)
+            header = [col.strip().lower() for col in next(rows, [])]
+            id_col = _find_column(header, ("id", "stop_id", "station_id"), "id")
+            name_col = _find_column(header, ("name", "stop_name", "station_name"), "name")
+            if id_col is None or name_col is None:
+                raise ValueError(f"Could not find ID/name columns in header {header}")
+
+            stations = {}
+            for row in rows:
+                if len(row) <= max(id_col, name_col): continue
+                station_id = normalize_station_id(operator, row[id_col])
+                name = " ".join(row[name_col].split())
+                if station_id and name:
+                    stations[station_id] = name
+
+        entries = sorted(((name, station_id) for station_id, name in stations.items()),
+                         key=lambda entry: _fold(entry[0]))
+        path = self._path(operator)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            for name, station_id in entries:
+                handle.write(f"{station_id}\t{name}\n")
+        os.replace(tmp_path, path)
+        return len(entries)
+
+    async def async_import(self, operator, source):
+        """Build the on-disk index for `operator` from a CSV/TSV station list."""
+        operator = str(operator).lower()
+        count = await self.hass.async_add_executor_job(self._import, operator, source)
+        # Drop the loaded copy, it is reloaded on the next query
+        self._indexes.pop(operator, None)
+        _LOGGER.info(f"Station index '{operator}': imported {count} stations from {source}")
+        return count
+
+
+def _find_column(header, names, fragment):
+    for name in names:
+        if name in header:
+            return header.index(name)
+    for pos, col in enumerate(header):
+        if fragment in col:
+            return pos
+    return None
+
+
+def get_station_index(hass: HomeAssistant) -> StationIndex:
+    """Return the shared station index, creating it on first use."""
+    index = hass.data.get(DATA_STATION_INDEX)
+    if index is None:
+        index = hass.data[DATA_STATION_INDEX] = StationIndex(hass)
+    return index
@@ -2,9 +2,8 @@
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN
+from .entity import TSkyltEntity
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
@@ -31,34 +30,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     ]
     async_add_entities(entities)
 
-class TSkyltSwitch(CoordinatorEntity, SwitchEntity):
+class TSkyltSwitch(TSkyltEntity, SwitchEntity):
     def __init__(self, coordinator, key, command, name, icon):
-        super().__init__(coordinator)
+        super().__init__(coordinator, key, name, icon)
         self._key = key
         self._command = command
-        self._name_suffix = name
-        self._icon = icon
 
     @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self.coordinator.host)}, name="T-Skylt Board", manufacturer="T-Skylt Sweden AB", model="Departure Board", sw_version=self.coordinator.sw_version)
-    @property
-    def name(self): return f"T-Skylt {self._name_suffix}"
-    @property
-    def unique_id(self): return f"{self.coordinator.host}_{self._key}"
-    @property
-    def is_on(self): return self.coordinator.data.get(self._key, False)
-    @property
-    def icon(self): return self._icon
+    def is_on(self): return self.coordinator.data.is_on(self._key)
 
+    # Commands are toggles: the coordinator checks the real state before sending
     async def async_turn_on(self, **kwargs):
-        if not self.is_on:
-            await self.coordinator.send_command(self._command)
-            self.coordinator.data[self._key] = True
-            self.async_write_ha_state()
+        await self.coordinator.send_toggle(self._key, self._command, True)
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
-        if self.is_on:
-            await self.coordinator.send_command(self._command)
-            self.coordinator.data[self._key] = False
-            self.async_write_ha_state()
\ No newline at end of file
+        await self.coordinator.send_toggle(self._key, self._command, False)
+        self.async_write_ha_state()
\ No newline at end of file
@@ -4,10 +4,12 @@ import urllib.parse
 from homeassistant.components.text import TextEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.restore_state import RestoreEntity
-from .const import DOMAIN
+from .const import DOMAIN, GROUP_SEARCH, GROUP_TIMERS
+from .entity import TSkyltEntity
+from .state import format_minutes, parse_minutes
+from .station_index import get_station_index
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
@@ -15,8 +17,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     entities = [
         # Station Group - Using SPECIAL class for Input
         TSkyltStationInput(coordinator, "newstation", "Station: ID Input", "mdi:map-marker"),
-        TSkyltStationSearch(coordinator, "searchstation", "Station: Title Search", "mdi:magnify"),
-        
+
         # View Group
         TSkyltText(coordinator, "no_more_departures", "View: No Departures Text", "mdi:message-text-outline"),
         TSkyltText(coordinator, "mins", "View: Minutes Suffix", "mdi:clock-end"),
@@ -25,43 +26,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         TSkyltText(coordinator, "user", "System: E-Mail", "mdi:email", EntityCategory.CONFIG),
     ]
 
-    # Timer Group
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    for day in days:
-        entities.append(TSkyltTimerText(coordinator, day, "start", f"Timer: {day} Start"))
-        entities.append(TSkyltTimerText(coordinator, day, "end", f"Timer: {day} End"))
+    # Search Group (optional)
+    if GROUP_SEARCH in coordinator.entity_groups:
+        entities.append(TSkyltStationSearch(coordinator, "searchstation", "Station: Title Search", "mdi:magnify"))
+
+    # Timer Group (optional)
+    if GROUP_TIMERS in coordinator.entity_groups:
+        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        for day in days:
+            entities.append(TSkyltTimerText(coordinator, day, "start", f"Timer: {day} Start"))
+            entities.append(TSkyltTimerText(coordinator, day, "end", f"Timer: {day} End"))
 
     async_add_entities(entities)
 
-class TSkyltText(CoordinatorEntity, TextEntity):
+class TSkyltText(TSkyltEntity, TextEntity):
     """Generic text entity (read from device)."""
     def __init__(self, coordinator, key, name, icon, category=None):
-        super().__init__(coordinator)
+        super().__init__(coordinator, key, name, icon, category)
         self._key = key
-        self._name_suffix = name
-        self._icon = icon
-        if category:
-            self._attr_entity_category = category
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self.coordinator.host)}, name="T-Skylt Board", manufacturer="T-Skylt Sweden AB", model="Departure Board", sw_version=self.coordinator.sw_version)
-    @property
-    def name(self): return f"T-Skylt {self._name_suffix}"
-    @property
-    def unique_id(self): return f"{self.coordinator.host}_{self._key}"
     @property
     def native_value(self): return self.coordinator.data.get(self._key, "")
-    @property
-    def icon(self): return self._icon
 
     async def async_set_value(self, value: str) -> None:
         encoded_val = urllib.parse.quote(value)
         await self.coordinator.send_command(f"?{self._key}={encoded_val}")
-        self.coordinator.data[self._key] = value
+        self.coordinator.data.set(self._key, value)
         self.async_write_ha_state()
 
-class TSkyltStationInput(CoordinatorEntity, TextEntity, RestoreEntity):
+class TSkyltStationInput(TSkyltEntity, TextEntity, RestoreEntity):
     """
     Special Text Entity for Station ID.
     The device does not report the active custom ID in the HTML (it defaults to 0/empty).
@@ -69,10 +62,8 @@ class TSkyltStationInput(CoordinatorEntity, TextEntity, RestoreEntity):
     and restore it after restarts.
     """
     def __init__(self, coordinator, key, name, icon):
-        super().__init__(coordinator)
+        super().__init__(coordinator, key, name, icon)
         self._key = key
-        self._name_suffix = name
-        self._icon = icon
         # We maintain our own state, independent of coordinator polling
         self._attr_native_value = ""
 
@@ -83,96 +74,82 @@ class TSkyltStationInput(CoordinatorEntity, TextEntity, RestoreEntity):
         if state and state.state not in (None, "unknown", "unavailable"):
             self._attr_native_value = state.state
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self.coordinator.host)}, name="T-Skylt Board", manufacturer="T-Skylt Sweden AB", model="Departure Board", sw_version=self.coordinator.sw_version)
-    @property
-    def name(self): return f"T-Skylt {self._name_suffix}"
-    @property
-    def unique_id(self): return f"{self.coordinator.host}_{self._key}"
     @property
     def native_value(self):
         # Always return local state, ignore coordinator data
         return self._attr_native_value
-    @property
-    def icon(self): return self._icon
 
     async def async_set_value(self, value: str) -> None:
-        encoded_val = urllib.parse.quote(value)
-        await self.coordinator.send_command(f"?{self._key}={encoded_val}")
+        # Always writes '?newstation=', re-entering the same ID restores a forgotten station
+        await self.coordinator.set_station(value)
         # Update local state
         self._attr_native_value = value
         self.async_write_ha_state()
 
-class TSkyltStationSearch(CoordinatorEntity, TextEntity):
+class TSkyltStationSearch(TSkyltEntity, TextEntity):
     """
-    Text Entity that triggers the two-step search on the device.
-    It does not read or hold state.
+    Text Entity that searches for a station.
+    Hits from the local station index are published right away, then the two-step
+    search always runs on the device: the board only learns (or re-learns after a
+    reboot) a station it has searched itself. It does not read or hold state.
     """
     def __init__(self, coordinator, key, name, icon):
-        super().__init__(coordinator)
+        super().__init__(coordinator, key, name, icon)
         self._key = key
-        self._name_suffix = name
-        self._icon = icon
         self._attr_native_value = ""
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self.coordinator.host)}, name="T-Skylt Board", manufacturer="T-Skylt Sweden AB", model="Departure Board", sw_version=self.coordinator.sw_version)
-    @property
-    def name(self): return f"T-Skylt {self._name_suffix}"
-    @property
-    def unique_id(self): return f"{self.coordinator.host}_{self._key}"
     @property
     def native_value(self):
         return self._attr_native_value
-    @property
-    def icon(self): return self._icon
 
     async def async_set_value(self, value: str) -> None:
         # We don't save this state, but update UI temporarily
         self._attr_native_value = value
         self.async_write_ha_state()
         
-        # Fire the new advanced search command on Coordinator
-        success = await self.coordinator.send_search_command(value)
+        # Local index first: instant result list without a board round trip
+        operator = self.coordinator.data.operator
+        local = await get_station_index(self.hass).async_search(operator, value)
+        if local:
+            self.coordinator.set_search_results(local)
+
+        # The board search is still needed so the board knows the station (never from cache)
+        results = await self.coordinator.send_search_command(value, use_cache=False)
+        if local and results is not None:
+            # Board hits first, local ones it did not return after them
+            seen = {station["id"] for station in results}
+            self.coordinator.set_search_results(results + [s for s in local if s["id"] not in seen])
         
         # Clear the field a moment later so it acts like a command input
         await asyncio.sleep(2)
         self._attr_native_value = ""
         self.async_write_ha_state()
 
-class TSkyltTimerText(CoordinatorEntity, TextEntity):
+class TSkyltTimerText(TSkyltEntity, TextEntity):
     """Timer specific text entity."""
+    _attr_pattern = r"^\d{1,2}:\d{2}$"
+
     def __init__(self, coordinator, day, type, name):
-        super().__init__(coordinator)
+        super().__init__(coordinator, f"timer_{day}_{type}", name, "mdi:timer-settings", EntityCategory.CONFIG)
         self._day = day
-        self._type = type 
-        self._name_suffix = name
-        self._icon = "mdi:timer-settings"
-        self._attr_entity_category = EntityCategory.CONFIG
+        self._type = type
+        # Data keys are fixed per entity, build them once
+        self._key_me = f"{day.lower()}_{type}"
+        self._key_other = f"{day.lower()}_{'end' if type == 'start' else 'start'}"
 
     @property
-    def device_info(self) -> DeviceInfo: return DeviceInfo(identifiers={(DOMAIN, self.coordinator.host)}, name="T-Skylt Board", manufacturer="T-Skylt Sweden AB", model="Departure Board", sw_version=self.coordinator.sw_version)
-    @property
-    def name(self): return f"T-Skylt {self._name_suffix}"
-    @property
-    def unique_id(self): return f"{self.coordinator.host}_timer_{self._day}_{self._type}"
-    @property
-    def native_value(self): 
-        key = f"{self._day.lower()}_{self._type}"
-        return self.coordinator.data.get(key, "00:00")
-    @property
-    def icon(self): return self._icon
+    def native_value(self):
+        # Stored as minutes since midnight
+        return format_minutes(self.coordinator.data.timer(self._key_me))
 
     async def async_set_value(self, value: str) -> None:
-        key_me = f"{self._day.lower()}_{self._type}"
-        key_other = f"{self._day.lower()}_{'end' if self._type == 'start' else 'start'}"
-        other_val = self.coordinator.data.get(key_other, "00:00")
+        minutes = parse_minutes(value)
+        value = format_minutes(minutes)
+        other_val = format_minutes(self.coordinator.data.timer(self._key_other))
         start = value if self._type == 'start' else other_val
         end = value if self._type == 'end' else other_val
         time_str = f"{start}to={end}"
         encoded_time = urllib.parse.quote(time_str)
         await self.coordinator.send_command(f"?set_timer={self._day}&start={encoded_time}")
-        self.coordinator.data[key_me] = value
+        self.coordinator.data.set_timer(self._key_me, minutes)
         self.async_write_ha_state()
\ No newline at end of file
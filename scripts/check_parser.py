@@ -0,0 +1,82 @@
+"""
+Check that the streaming status page parser matches the full-page parser.
+
+Feeds each page to `StatusPageParser` chunk by chunk, exactly like a poll does
+(stopping as soon as the parser reports completion), and compares the result
+with `TSkyltCoordinator.parse_html` (BeautifulSoup) on the whole page. Without
+arguments, the fake board's page is checked in both its <select> and <input>
+layouts. Pass captured pages to check real firmware output:
+
+    curl -s http://192.168.1.50/ > page.html
+    python scripts/check_parser.py page.html
+
+Exit code 1 on any difference.
+"""
+import argparse
+import sys
+from types import SimpleNamespace
+
+from fake_board import FakeBoard
+
+from custom_components.t_skylt.coordinator import STREAM_CHUNK_SIZE, TSkyltCoordinator
+from custom_components.t_skylt.parser import StatusPageParser
+
+
+def stream_parse(html, chunk_size=STREAM_CHUNK_SIZE):
+    """Parsed state, version and bytes consumed, the way `_parse_stream` reads the page."""
+    body = html.encode("utf-8")
+    parser = StatusPageParser()
+    consumed = 0
+    for start in range(0, len(body), chunk_size):
+        chunk = body[start:start + chunk_size]
+        consumed += len(chunk)
+        parser.feed(chunk.decode("utf-8", errors="replace"))
+        if parser.complete:
+            break
+    parser.close()
+    return parser.result(), parser.sw_version, consumed
+
+
+def full_parse(html):
+    """State and version from the BeautifulSoup fallback."""
+    holder = SimpleNamespace(sw_version="Unknown")
+    state = TSkyltCoordinator.parse_html(holder, html)
+    return state, holder.sw_version
+
+
+def check(name, html):
+    streamed, streamed_version, consumed = stream_parse(html)
+    full, full_version = full_parse(html)
+    problems = [f"{key}: stream={streamed.get(key)!r} full={full.get(key)!r}" for key in sorted(streamed.diff(full))]
+    if streamed_version != full_version:
+        problems.append(f"sw_version: stream={streamed_version!r} full={full_version!r}")
+    size = len(html.encode("utf-8"))
+    status = "OK" if not problems else "MISMATCH"
+    print(f"{status} {name}: read {consumed} of {size} bytes")
+    for problem in problems:
+        print(f"    {problem}")
+    return not problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("pages", nargs="*", help="Captured status pages (HTML files)")
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = []
+        for path in args.pages:
+            with open(path, encoding="utf-8", errors="replace") as handle:
+                pages.append((path, handle.read()))
+    else:
+        pages = [
+            ("fake board (select layout)", FakeBoard().render()),
+            ("fake board (input layout)", FakeBoard(select_inputs=True).render()),
+        ]
+
+    results = [check(name, html) for name, html in pages]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
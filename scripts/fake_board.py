@@ -0,0 +1,244 @@
+"""
+Local fake T-Skylt board for replay and load tests.
+
+Serves a status page with the same element IDs as the real firmware, applies
+toggle/set commands to its state, answers HEAD probes and the two-step
+station search. Latency and status codes can be scripted per request
+(see `FakeBoard.plan`), which the replay tool uses to reproduce recorded traces.
+
+Run standalone:  python scripts/fake_board.py --port 8080 [--count 50]
+"""
+import argparse
+import asyncio
+import math
+import sys
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+from aiohttp import web
+
+# Make `custom_components.t_skylt` importable for the tools in this directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.t_skylt.parser import SWITCH_INPUTS  # noqa: E402
+from custom_components.t_skylt.state import DAYS  # noqa: E402
+
+# Commands that flip a switch, as sent by TSkyltSwitch
+TOGGLES = {
+    "onoff": "onoff", "listcolor": "listcolor", "fontmini": "fontmini", "listmode": "listmode",
+    "clocktime": "clocktime", "sleep": "sleep", "show_station": "show_station", "multiple": "multiple",
+}
+HANG = 30           # Seconds a scripted failure keeps the client waiting
+PADDING_ROWS = 150  # Filler rows after the status table, the real page is ~20 KB
+
+
+class FakeBoard:
+    """In-process fake board. `start()` returns the port it listens on."""
+
+    def __init__(self, latency=0.05, version="v. 2.13", boot_time=3.0, select_inputs=False):
+        self.latency = latency
+        # Render maxdest/offset as <input> instead of <select> (older firmware layout)
+        self.select_inputs = select_inputs
+        self.version = version
+        self.boot_time = boot_time
+        self.switches = {key: False for key in SWITCH_INPUTS}
+        self.switches["onoff"] = True
+        self.values = {"brightness": "1", "scroll": "0", "maxdest": "5", "offset": "0"}
+        self.update_available = False
+        self.booted_at = time.monotonic()
+        self.requests = defaultdict(int)
+        self._plans = defaultdict(deque)
+        self._runner = None
+
+    # --- Scripting ---
+    def plan(self, key, delay, status=200):
+        """Answer the next request for `key` after `delay` s with `status` (None: hang, then drop)."""
+        self._plans[key].append((delay, status))
+
+    def _next(self, key):
+        plans = self._plans.get(key)
+        if plans:
+            return plans.popleft()
+        return self.latency, 200
+
+    # --- State ---
+    @property
+    def uptime(self):
+        return max(0, int((time.monotonic() - self.booted_at) // 60))
+
+    def _apply(self, path, query):
+        if path == "update" and query.get("update") == "true":
+            # Simulated OTA: new version after the reboot
+            major, minor = self.version.split()[-1].split(".")
+            self.version = f"v. {major}.{int(minor) + 1}"
+            self.update_available = False
+            self.booted_at = time.monotonic() + self.boot_time
+            return
+        if path == "stop":
+            self.booted_at = time.monotonic() + self.boot_time
+            return
+        for param, value in query.items():
+            if param in TOGGLES:
+                self.switches[TOGGLES[param]] = not self.switches[TOGGLES[param]]
+            elif param == "type":
+                key = f"type_{value}"
+                if key in self.switches:
+                    self.switches[key] = not self.switches[key]
+            elif param in self.values:
+                self.values[param] = value
+
+    def render(self):
+        parts = [f"<html><head><title>T-Skylt</title></head><body><h1>T-Skylt {self.version}</h1>",
+                 '<label for="operator">Operator</label><div><button class="dropbtn">&#9660; BE</button></div>']
+        for key, el_id in SWITCH_INPUTS.items():
+            checked = " checked" if self.switches[key] else ""
+            parts.append(f'<input type="checkbox" id="{el_id}"{checked}>')
+        for key, value in self.values.items():
+            if self.select_inputs and key in ("maxdest", "offset"):
+                parts.append(f'<input id="{key}" value="{value}">')
+                continue
+            options = "".join(
+                f'<option value="{i}"{" selected" if str(i) == value else ""}>{i}</option>' for i in range(9)
+            )
+            parts.append(f'<select id="{key}">{options}</select>')
+        parts.append('<input id="power" value="20"><input id="line_length" value="3">'
+                     '<input id="no_more_departures" value=""><input id="mins" value="min"><input id="user" value="">')
+        for day in DAYS:
+            parts.append(f'<input id="{day}StartTime" value="06:00"><input id="{day}EndTime" value="23:00">')
+        disabled = "" if self.update_available else " disabled"
+        parts.append(f"<button onclick=\"location.href='update?update=true'\"{disabled}>Update</button>")
+        parts.append(f"<table><tr><td><b>System temperature</b></td><td>45 &deg;C</td></tr>"
+                     f"<tr><td><b>Uptime</b></td><td>{self.uptime} min</td></tr></table>")
+        parts.extend(f"<p>Departure {i}: Bus 100 S+U Alexanderplatz</p>" for i in range(PADDING_ROWS))
+        parts.append("</body></html>")
+        return "".join(parts)
+
+    # --- HTTP ---
+    async def _handle(self, request):
+        if request.method in ("HEAD", "POST"):
+            # Same keys as the coordinator's trace: HEAD probe, search POST
+            key = request.method
+        else:
+            key = request.path_qs.lstrip("/") or "/"
+        self.requests[key] += 1
+        delay, status = self._next(key)
+
+        if time.monotonic() < self.booted_at:
+            # Rebooting: behave like an unreachable board
+            await asyncio.sleep(HANG)
+            raise web.HTTPServiceUnavailable()
+        if status is None:
+            await asyncio.sleep(HANG)
+            raise web.HTTPServiceUnavailable()
+        await asyncio.sleep(delay)
+        if status >= 400:
+            return web.Response(status=status)
+
+        if request.method == "POST":
+            return web.Response(text="<html>OK</html>", content_type="text/html")
+        if request.path == "/search":
+            return web.Response(content_type="text/html", text=(
+                '<html><a href="/?newstation=9000100003">S+U Alexanderplatz Bhf (Berlin)</a>'
+                '<a href="/?newstation=9000003201">S+U Berlin Hauptbahnhof</a></html>'))
+        if request.method == "HEAD":
+            return web.Response(content_type="text/html")
+
+        path = request.path.lstrip("/")
+        if path or request.query:
+            self._apply(path, request.query)
+            return web.Response(text="OK")
+        return web.Response(text=self.render(), content_type="text/html")
+
+    async def start(self, host="127.0.0.1", port=0):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return self._runner.addresses[0][1]
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a periodic sleeper."""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.samples = []
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile, None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(fraction * len(ordered))) - 1]
+
+
+def summarize(values, scale=1000.0):
+    """p50/p95/p99/max (in ms by default) of a list of seconds."""
+    if not values:
+        return {"n": 0}
+    return {
+        "n": len(values),
+        "p50": round(percentile(values, 0.5) * scale, 2),
+        "p95": round(percentile(values, 0.95) * scale, 2),
+        "p99": round(percentile(values, 0.99) * scale, 2),
+        "max": round(max(values) * scale, 2),
+    }
+
+
+async def create_hass(config_dir):
+    """Minimal Home Assistant core instance to host coordinators outside a full install."""
+    from homeassistant.core import HomeAssistant
+
+    hass = HomeAssistant(config_dir)
+    return hass
+
+
+async def _serve(args):
+    boards = [FakeBoard(latency=args.latency) for _ in range(args.count)]
+    for offset, board in enumerate(boards):
+        await board.start(args.host, args.port + offset)
+    last = args.port + args.count - 1
+    print(f"{args.count} fake T-Skylt board(s) on http://{args.host}:{args.port}..{last}/ (Ctrl+C to stop)", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for board in boards:
+            await board.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--count", type=int, default=1, help="Number of boards on consecutive ports")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per response")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
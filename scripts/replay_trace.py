@@ -0,0 +1,174 @@
+"""
+Replay a recorded T-Skylt request trace against a local fake board.
+
+Reads the JSONL files written by the coordinator's trace recorder
+(option "Record request trace"), scripts the fake board with the recorded
+durations and status codes, and re-issues the polls, commands and health
+checks (and station searches, with a placeholder query) through a real
+TSkyltCoordinator at 1x or accelerated speed.
+Reports throughput, per-kind latency and event-loop lag.
+
+    python scripts/replay_trace.py /config/t_skylt_trace_192.168.1.50.jsonl* --speed 20
+"""
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+import time
+from collections import defaultdict
+
+from fake_board import FakeBoard, LoopLagMonitor, create_hass, summarize
+
+from custom_components.t_skylt.coordinator import TSkyltCoordinator
+
+_LOGGER = logging.getLogger("replay")
+
+# The trace holds no search terms, any query exercises the same two requests
+SEARCH_QUERY = "replay"
+
+
+def load_trace(paths):
+    """All records of the given (rotated) files, oldest first."""
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if line:
+                    records.append(json.loads(line))
+    records.sort(key=lambda rec: rec["t"])
+    return records
+
+
+def _failed(record):
+    status = record["s"]
+    return not isinstance(status, int) or status >= 400
+
+
+def intents(records):
+    """
+    Records that start a request, i.e. what the user/poller asked for.
+    Retries (a phase 1 request following a failed one with the same param),
+    failover phases, the GET fallback of a rejected HEAD probe and the GET of a
+    search are consequences the coordinator reproduces on its own.
+    """
+    last_failed = {}
+    head_failed = False
+    for record in records:
+        phase = record["ph"]
+        if phase == "health":
+            if not (head_failed and record["p"] is None):
+                yield record
+            head_failed = record["p"] == "HEAD" and _failed(record)
+        elif phase == "search":
+            if record["p"] == "POST":
+                yield record
+        elif phase == "1":
+            if not last_failed.get(record["p"]):
+                yield record
+            last_failed[record["p"]] = _failed(record)
+
+
+def board_key(record):
+    """Request key the fake board sees for a recorded request."""
+    return record["p"] or "/"
+
+
+async def _drive(coordinator, record, latencies, failures):
+    if record["ph"] in ("health", "search"):
+        kind = record["ph"]
+    else:
+        kind = "poll" if record["p"] is None else "command"
+    started = time.monotonic()
+    try:
+        if kind == "poll":
+            await coordinator.async_refresh()
+            ok = coordinator.last_update_success
+        elif kind == "health":
+            ok = await coordinator.async_check_health()
+        elif kind == "search":
+            ok = await coordinator.send_search_command(SEARCH_QUERY, use_cache=False) is not None
+        else:
+            ok = await coordinator.send_command(record["p"]) is not None
+    except Exception as err:
+        _LOGGER.debug(f"{kind} {record['p']} failed: {err}")
+        ok = False
+    latencies[kind].append(time.monotonic() - started)
+    if not ok:
+        failures[kind] += 1
+
+
+async def replay(paths, speed, board_latency, script_board=True):
+    records = load_trace(paths)
+    if not records:
+        raise SystemExit("Trace is empty")
+    todo = list(intents(records))
+
+    board = FakeBoard(latency=board_latency)
+    port = await board.start()
+    hass = await create_hass(tempfile.mkdtemp(prefix="t_skylt_replay_"))
+    coordinator = TSkyltCoordinator(hass, f"127.0.0.1:{port}")
+    # Only the replayed polls should hit the board
+    coordinator.update_interval = None
+
+    monitor = LoopLagMonitor()
+    monitor.start()
+    latencies = defaultdict(list)
+    failures = defaultdict(int)
+    tasks = []
+
+    loop = asyncio.get_running_loop()
+    origin = records[0]["t"]
+    started = loop.time()
+    index = 0
+    for record in todo:
+        due = started + (record["t"] - origin) / speed
+        if script_board:
+            # Feed every recorded response (incl. retries/failover) up to this point
+            while index < len(records) and records[index]["t"] <= record["t"]:
+                rec = records[index]
+                status = rec["s"] if isinstance(rec["s"], int) else None
+                board.plan(board_key(rec), rec["d"] / speed, status)
+                index += 1
+        await asyncio.sleep(max(0.0, due - loop.time()))
+        tasks.append(asyncio.create_task(_drive(coordinator, record, latencies, failures)))
+
+    await asyncio.gather(*tasks)
+    elapsed = loop.time() - started
+    await monitor.stop()
+    await coordinator.async_shutdown()
+    await board.stop()
+    await hass.async_stop(force=True)
+
+    return {
+        "records": len(records),
+        "replayed": len(todo),
+        "speed": speed,
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(len(todo) / elapsed, 2) if elapsed else None,
+        "latency_ms": {kind: summarize(values) for kind, values in latencies.items()},
+        "failures": dict(failures),
+        "loop_lag_ms": summarize(monitor.samples),
+        "board_requests": dict(board.requests),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("trace", nargs="+", help="Trace file(s), rotated backups included")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed factor (1 = real time)")
+    parser.add_argument("--board-latency", type=float, default=0.05,
+                        help="Response time for requests without a recorded counterpart")
+    parser.add_argument("--no-script", action="store_true",
+                        help="Ignore recorded durations/statuses, answer everything with --board-latency")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+
+    report = asyncio.run(replay(args.trace, args.speed, args.board_latency, not args.no_script))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
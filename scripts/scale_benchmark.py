@@ -0,0 +1,229 @@
+"""
+Multi-board scale benchmark for the T-Skylt integration.
+
+Starts N fake boards on localhost, sets up N TSkyltCoordinators with the
+entities of all platforms attached, then runs staggered polling plus
+rotation-style command traffic (`rotate_stations` and toggles) for a while.
+Reports event-loop lag, CPU usage, memory per board and poll completion times.
+
+With --max-lag-ms / --max-poll-ms / --max-failures it doubles as a regression
+gate: the exit code is 1 if the p99 loop lag, the p95 poll time or the number
+of failed polls, rotations and toggles exceeds the limit.
+
+    python scripts/scale_benchmark.py --boards 50 --duration 120
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+
+from fake_board import FakeBoard, LoopLagMonitor, create_hass, summarize
+
+from custom_components.t_skylt import _platforms_for_groups
+from custom_components.t_skylt.const import DOMAIN
+from custom_components.t_skylt.coordinator import TSkyltCoordinator
+
+_LOGGER = logging.getLogger("scale_benchmark")
+
+BASE_PORT = 18080
+# Rotation lists as used in the README automation (local IDs, any value works on the fake board)
+ROTATION = ["9000100003", "9000003201", "9000023201"]
+TOGGLES = [("listcolor", "?listcolor=switch"), ("clocktime", "?clocktime=switch"), ("type_bus", "?type=bus")]
+
+
+async def _start_boards(count, latency, in_process):
+    """Fake boards in this process (shares the loop) or in a child process (default)."""
+    if in_process:
+        boards = [FakeBoard(latency=latency) for _ in range(count)]
+        ports = [await board.start() for board in boards]
+        return boards, ports, None
+
+    script = Path(__file__).resolve().parent / "fake_board.py"
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, str(script), "--port", str(BASE_PORT), "--count", str(count), "--latency", str(latency),
+        stdout=subprocess.PIPE,
+    )
+    # The child prints one line once every board listens
+    await asyncio.wait_for(proc.stdout.readline(), 30)
+    return [], [BASE_PORT + offset for offset in range(count)], proc
+
+
+async def _setup_board(hass, index, port):
+    """Coordinator plus the entities of every platform, wired like HA does on setup."""
+    entry = SimpleNamespace(entry_id=f"bench_{index}", options={})
+    coordinator = TSkyltCoordinator(hass, f"127.0.0.1:{port}", options=entry.options)
+    # Polls are driven by the benchmark so their duration can be measured
+    coordinator.update_interval = None
+    await coordinator.async_refresh()
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+
+    coordinator.platforms = _platforms_for_groups(coordinator.entity_groups)
+    entities = []
+    for platform in coordinator.platforms:
+        module = importlib.import_module(f"custom_components.t_skylt.{platform}")
+        added = []
+        await module.async_setup_entry(hass, entry, added.extend)
+        for number, entity in enumerate(added):
+            entity.hass = hass
+            entity.entity_id = f"{platform}.t_skylt_{index}_{number}"
+            # What CoordinatorEntity.async_added_to_hass registers
+            entity.async_on_remove(coordinator.async_add_listener(entity._handle_coordinator_update))
+            entity.async_write_ha_state()
+        entities.extend(added)
+    return coordinator, entities
+
+
+async def _poll_loop(coordinator, interval, stop, poll_times, failures):
+    await asyncio.sleep(random.uniform(0, interval))
+    while not stop.is_set():
+        started = time.monotonic()
+        await coordinator.async_refresh()
+        poll_times.append(time.monotonic() - started)
+        if not coordinator.last_update_success:
+            failures["poll"] += 1
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _command_loop(coordinator, rate, stop, command_times, failures):
+    """Poisson-ish traffic: mostly station rotation, some toggles."""
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), random.expovariate(rate / 60))
+            return
+        except asyncio.TimeoutError:
+            pass
+        started = time.monotonic()
+        if random.random() < 0.7:
+            kind = "rotate"
+            ok = await coordinator.rotate_stations(ROTATION) is not None
+        else:
+            kind = "toggle"
+            key, command = random.choice(TOGGLES)
+            ok = await coordinator.send_toggle(key, command, not coordinator.data.is_on(key))
+        command_times[kind].append(time.monotonic() - started)
+        if not ok:
+            failures[kind] += 1
+
+
+async def benchmark(args):
+    boards, ports, proc = await _start_boards(args.boards, args.board_latency, args.in_process)
+    hass = await create_hass(tempfile.mkdtemp(prefix="t_skylt_bench_"))
+    hass.data[DOMAIN] = {}
+
+    # --- Setup: memory per board ---
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    setup_started = time.monotonic()
+    results = await asyncio.gather(*(_setup_board(hass, i, port) for i, port in enumerate(ports)))
+    setup_time = time.monotonic() - setup_started
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    coordinators = [coordinator for coordinator, _ in results]
+    entity_count = sum(len(entities) for _, entities in results)
+
+    # --- Load: polls + commands ---
+    stop = asyncio.Event()
+    poll_times = []
+    command_times = defaultdict(list)
+    failures = defaultdict(int)
+    monitor = LoopLagMonitor()
+    monitor.start()
+    cpu_started = time.process_time()
+    wall_started = time.monotonic()
+    tasks = [asyncio.create_task(_poll_loop(c, args.poll_interval, stop, poll_times, failures)) for c in coordinators]
+    if args.command_rate:
+        tasks += [asyncio.create_task(_command_loop(c, args.command_rate, stop, command_times, failures))
+                  for c in coordinators]
+
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+    wall = time.monotonic() - wall_started
+    cpu = time.process_time() - cpu_started
+    await monitor.stop()
+
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+    for board in boards:
+        await board.stop()
+    if proc:
+        proc.terminate()
+        await proc.wait()
+    await hass.async_stop(force=True)
+
+    commands = sum(len(times) for times in command_times.values())
+    return {
+        "boards": args.boards,
+        "entities": entity_count,
+        "boards_in_process": args.in_process,
+        "setup_s": round(setup_time, 2),
+        "memory_per_board_kb": round((after - before) / args.boards / 1024, 1),
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "duration_s": round(wall, 1),
+        "cpu_percent": round(100 * cpu / wall, 1),
+        "polls": len(poll_times),
+        "commands": commands,
+        "requests_per_s": round((len(poll_times) + commands) / wall, 2),
+        "poll_ms": summarize(poll_times),
+        "command_ms": {kind: summarize(times) for kind, times in command_times.items()},
+        "failures": dict(failures),
+        "loop_lag_ms": summarize(monitor.samples),
+    }
+
+
+def _gate(report, args):
+    """Names of the limits the report exceeds."""
+    violations = []
+    lag = report["loop_lag_ms"].get("p99")
+    if args.max_lag_ms is not None and lag is not None and lag > args.max_lag_ms:
+        violations.append(f"loop lag p99 {lag} ms > {args.max_lag_ms} ms")
+    poll = report["poll_ms"].get("p95")
+    if args.max_poll_ms is not None and poll is not None and poll > args.max_poll_ms:
+        violations.append(f"poll p95 {poll} ms > {args.max_poll_ms} ms")
+    failed = sum(report["failures"].values())
+    if args.max_failures is not None and failed > args.max_failures:
+        details = ", ".join(f"{count} {kind}" for kind, count in sorted(report["failures"].items()))
+        violations.append(f"{failed} failed request(s) ({details}) > {args.max_failures}")
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--boards", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=60, help="Seconds of load after setup")
+    parser.add_argument("--poll-interval", type=float, default=10, help="Seconds between polls per board")
+    parser.add_argument("--command-rate", type=float, default=6, help="Commands per board and minute (0: polls only)")
+    parser.add_argument("--board-latency", type=float, default=0.05, help="Fake board response time in seconds")
+    parser.add_argument("--in-process", action="store_true", help="Run the fake boards on the benchmark's loop")
+    parser.add_argument("--max-lag-ms", type=float, help="Fail if the p99 event-loop lag exceeds this")
+    parser.add_argument("--max-poll-ms", type=float, help="Fail if the p95 poll time exceeds this")
+    parser.add_argument("--max-failures", type=int, help="Fail if more polls and commands failed than this")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    random.seed(args.seed)
+
+    report = asyncio.run(benchmark(args))
+    violations = _gate(report, args)
+    report["violations"] = violations
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()